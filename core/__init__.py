@@ -0,0 +1,4 @@
+# make sure the celery app is loaded when django starts so @shared_task uses it
+from .celery import app as celery_app
+
+__all__ = ["celery_app"]
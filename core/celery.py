@@ -0,0 +1,11 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+app = Celery("core")
+
+# read CELERY_* settings from django settings
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
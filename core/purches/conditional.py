@@ -0,0 +1,54 @@
+"""
+Conditional GET for endpoints that clients poll.
+
+A view derives validators from one cheap query (a row's updated_at, or
+max(updated_at) and a count for a list) before doing any real work. If the
+client's If-None-Match / If-Modified-Since still match, a 304 goes back
+without running the serializer; otherwise the response carries the ETag (and
+Last-Modified, for single rows) for the next poll. ETags also cover the user,
+the query string and the negotiated media type, since each of them changes
+the body.
+
+Lists pass no last_modified: a row leaving a list doesn't raise its
+max(updated_at), so If-Modified-Since would keep serving the stale list.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    def not_modified(self, request, last_modified, *state):
+        """
+        Return a 304 response when the client's copy is current, else None.
+        Either way the validators are added to the response. With
+        last_modified=None only the ETag (over `state`) is checked.
+        """
+        parts = (
+            getattr(request.user, "pk", None),
+            request.get_full_path(),
+            getattr(request, "accepted_media_type", ""),
+            last_modified.isoformat() if last_modified else "",
+            *state,
+        )
+        digest = hashlib.md5(
+            "|".join(map(str, parts)).encode(), usedforsecurity=False
+        ).hexdigest()
+        etag = quote_etag(digest)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        self._conditional_validators = (etag, timestamp)
+        return get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, "_conditional_validators", None)
+        if validators and response.status_code in (200, 304):
+            etag, timestamp = validators
+            response.headers.setdefault("ETag", etag)
+            if timestamp is not None:
+                response.headers.setdefault("Last-Modified", http_date(timestamp))
+            # clients may keep the body but must revalidate before using it
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
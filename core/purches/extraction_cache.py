@@ -0,0 +1,105 @@
+import hashlib
+import logging
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.purches.models import ProformaExtractionCache
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def cache_enabled() -> bool:
+    return bool(getattr(settings, "PROFORMA_CACHE_ENABLED", True))
+
+
+def file_digest(file_obj) -> str:
+    """sha256 of the file bytes; leaves the file rewound."""
+    h = hashlib.sha256()
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(_CHUNK_SIZE), b""):
+        h.update(chunk)
+    file_obj.seek(0)
+    return h.hexdigest()
+
+
+def _to_decimal(value):
+    if value is None or isinstance(value, Decimal):
+        return value
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _restore_decimals(extracted: dict) -> dict:
+    # JSON stores Decimals as strings; hand back the same types as a fresh parse
+    out = dict(extracted)
+    if "total_amount" in out:
+        out["total_amount"] = _to_decimal(out["total_amount"])
+    out["items"] = [
+        {**it, "unit_price": _to_decimal(it.get("unit_price"))}
+        for it in out.get("items") or []
+    ]
+    return out
+
+
+def get_cached_extraction(digest: str, version: str):
+    entry = (
+        ProformaExtractionCache.objects.filter(digest=digest, extractor_version=version)
+        .only("id", "extracted")
+        .first()
+    )
+    if entry is None:
+        return None
+    ProformaExtractionCache.objects.filter(id=entry.id).update(
+        hits=F("hits") + 1, last_used_at=timezone.now()
+    )
+    return _restore_decimals(entry.extracted)
+
+
+def store_extraction(digest: str, version: str, extracted: dict) -> None:
+    try:
+        with transaction.atomic():
+            ProformaExtractionCache.objects.create(
+                digest=digest, extractor_version=version, extracted=extracted
+            )
+    except IntegrityError:
+        # a concurrent upload of the same file stored it first
+        return
+    evict_over_capacity()
+
+
+def evict_over_capacity(max_entries=None) -> int:
+    """Drop least recently used entries beyond PROFORMA_CACHE_MAX_ENTRIES."""
+    if max_entries is None:
+        max_entries = int(getattr(settings, "PROFORMA_CACHE_MAX_ENTRIES", 5000))
+    stale_ids = list(
+        ProformaExtractionCache.objects.order_by("-last_used_at", "-id").values_list(
+            "id", flat=True
+        )[max_entries:]
+    )
+    if not stale_ids:
+        return 0
+    deleted, _ = ProformaExtractionCache.objects.filter(id__in=stale_ids).delete()
+    logger.info("evicted %s proforma cache entries", deleted)
+    return deleted
+
+
+def purge(older_than=None, keep_version=None) -> int:
+    """
+    Delete cache entries. `older_than` limits to entries unused since that
+    datetime; `keep_version` limits to entries from other extractor versions.
+    """
+    qs = ProformaExtractionCache.objects.all()
+    if older_than is not None:
+        qs = qs.filter(last_used_at__lt=older_than)
+    if keep_version is not None:
+        qs = qs.exclude(extractor_version=keep_version)
+    deleted, _ = qs.delete()
+    return deleted
@@ -0,0 +1,158 @@
+"""
+Field extraction for proforma text and tables.
+
+Patterns are compiled once at import. A table's header row is classified
+once into a field -> column index map and every row is parsed through that
+map. Vendor templates, picked by a fingerprint regex over the document
+text, can override patterns and column keywords.
+"""
+
+import json
+import re
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+
+INVOICE_NO_RE = re.compile(r"Invoice\s*No[:\s]*([A-Za-z0-9\-\/]+)", re.I)
+TOTAL_RE = re.compile(r"Total\s*[:\s]*\$?([\d,\.]+)", re.I)
+
+_PRICE_STRIP = str.maketrans("", "", ",$")
+
+# field -> header keywords; a column belongs to a field when any keyword is
+# a substring of its lowercased header. When several columns match, the
+# right-most one wins.
+DEFAULT_COLUMNS = {
+    "name": ("description", "item", "name"),
+    "quantity": ("qty", "quantity"),
+    "unit_price": ("price", "unit"),
+}
+
+
+def _to_quantity(cell):
+    try:
+        return int(cell)
+    except (ValueError, TypeError):
+        return 1
+
+
+def _to_price(cell):
+    try:
+        return Decimal(cell.translate(_PRICE_STRIP))
+    except (ValueError, TypeError, AttributeError, InvalidOperation):
+        return None
+
+
+class VendorTemplate:
+    def __init__(
+        self,
+        name,
+        fingerprint=None,
+        vendor=None,
+        invoice_no_re=INVOICE_NO_RE,
+        total_re=TOTAL_RE,
+        columns=None,
+    ):
+        self.name = name
+        self.fingerprint = re.compile(fingerprint, re.I) if fingerprint else None
+        self.vendor = vendor
+        self.invoice_no_re = (
+            re.compile(invoice_no_re, re.I)
+            if isinstance(invoice_no_re, str)
+            else invoice_no_re
+        )
+        self.total_re = (
+            re.compile(total_re, re.I) if isinstance(total_re, str) else total_re
+        )
+        self.columns = {**DEFAULT_COLUMNS, **(columns or {})}
+
+    def matches(self, text) -> bool:
+        return bool(self.fingerprint and self.fingerprint.search(text or ""))
+
+    def match_header_fields(self, text, extracted):
+        """Fill invoice_no / total_amount from text unless already found."""
+        if "invoice_no" not in extracted:
+            m = self.invoice_no_re.search(text)
+            if m:
+                extracted["invoice_no"] = m.group(1).strip()
+        if "total_amount" not in extracted:
+            m = self.total_re.search(text)
+            if m:
+                total = _to_price(m.group(1))
+                if total is not None:
+                    extracted["total_amount"] = total
+        if self.vendor and not extracted.get("vendor"):
+            extracted["vendor"] = self.vendor
+
+    def column_map(self, header_row):
+        """Classify a header row once: field -> column index."""
+        headers = [c.strip().lower() if c else "" for c in header_row]
+        colmap = {}
+        for idx, h in enumerate(headers):
+            for field, keywords in self.columns.items():
+                if any(k in h for k in keywords):
+                    colmap[field] = idx
+        return colmap
+
+    def parse_table(self, table):
+        """Return line items from a table whose first row is the header."""
+        if not table:
+            return []
+        colmap = self.column_map(table[0])
+        name_idx = colmap.get("name")
+        if name_idx is None:
+            return []
+        qty_idx = colmap.get("quantity")
+        price_idx = colmap.get("unit_price")
+
+        items = []
+        for row in table[1:]:
+            width = len(row)
+            name = row[name_idx] if name_idx < width else ""
+            if not name:
+                continue
+            qty = 1
+            if qty_idx is not None:
+                qty = _to_quantity(row[qty_idx] if qty_idx < width else "")
+            unit = None
+            if price_idx is not None:
+                unit = _to_price(row[price_idx] if price_idx < width else "")
+            items.append({"name": name, "quantity": qty, "unit_price": unit})
+        return items
+
+
+DEFAULT_TEMPLATE = VendorTemplate("default")
+
+_templates = []
+# (settings key, templates) built from PROFORMA_VENDOR_TEMPLATES
+_configured = (None, [])
+
+
+def _configured_templates():
+    """
+    Templates declared in PROFORMA_VENDOR_TEMPLATES (list of kwargs), rebuilt
+    whenever the setting changes so extraction always uses the templates that
+    services.extractor_version() hashes into the cache key.
+    """
+    global _configured
+    specs = getattr(settings, "PROFORMA_VENDOR_TEMPLATES", None) or []
+    key = json.dumps(specs, sort_keys=True, default=repr)
+    if _configured[0] != key:
+        _configured = (key, [VendorTemplate(**spec) for spec in specs])
+    return _configured[1]
+
+
+def register_template(template):
+    """Add a vendor template; tried in order, before the configured ones."""
+    _templates.append(template)
+    return template
+
+
+def unregister_template(name):
+    _templates[:] = [t for t in _templates if t.name != name]
+
+
+def select_template(text):
+    for template in (*_templates, *_configured_templates()):
+        if template.matches(text):
+            return template
+    return DEFAULT_TEMPLATE
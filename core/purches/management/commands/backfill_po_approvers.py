@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from core.purches.models import PurchaseOrder
+from core.purches.serializers.purchase_order import resolve_approvers
+
+SNAPSHOT_FIELDS = ["approved_by", "approver_first_name", "approver_last_name"]
+
+
+def _data_approver_id(po):
+    approver = (po.data or {}).get("approver")
+    if isinstance(approver, dict):
+        try:
+            return int(approver.get("id") or 0) or None
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+class Command(BaseCommand):
+    help = "Fill the approver snapshot on purchase orders created before it existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        batch_size = options["batch_size"]
+        qs = PurchaseOrder.objects.filter(approved_by__isnull=True).only(
+            "id", "purchase_request_id", "data"
+        )
+
+        last_pk, scanned, updated = 0, 0, 0
+        while True:
+            batch = list(qs.filter(pk__gt=last_pk).order_by("pk")[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            scanned += len(batch)
+
+            resolved = resolve_approvers(batch)
+            # POs generated with data["approver"] but no Approval rows
+            fallback = {
+                po.pk: _data_approver_id(po) for po in batch if po.pk not in resolved
+            }
+            fallback = {pk: uid for pk, uid in fallback.items() if uid}
+            users = User.objects.in_bulk(set(fallback.values())) if fallback else {}
+            for pk, uid in fallback.items():
+                if uid in users:
+                    resolved[pk] = users[uid]
+
+            changed = []
+            for po in batch:
+                user = resolved.get(po.pk)
+                if user is not None:
+                    po.set_approver(user)
+                    changed.append(po)
+            if changed and not options["dry_run"]:
+                PurchaseOrder.objects.bulk_update(changed, SNAPSHOT_FIELDS)
+            updated += len(changed)
+
+        verb = "would update" if options["dry_run"] else "updated"
+        self.stdout.write(
+            self.style.SUCCESS(f"scanned {scanned} purchase orders, {verb} {updated}")
+        )
@@ -0,0 +1,88 @@
+import difflib
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image
+
+from core.purches import ocr, ocr_preprocess
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp"}
+
+
+def _normalize(text):
+    return " ".join((text or "").lower().split())
+
+
+def _accuracy(expected, got):
+    return difflib.SequenceMatcher(None, _normalize(expected), _normalize(got)).ratio()
+
+
+class Command(BaseCommand):
+    help = (
+        "OCR a fixture corpus with and without preprocessing and report time "
+        "and accuracy. Each image needs a sibling .txt file with the expected "
+        "text (e.g. receipt1.jpg + receipt1.txt)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixture_dir")
+        parser.add_argument(
+            "--steps",
+            default=",".join(ocr_preprocess.STEPS),
+            help="comma-separated preprocessing steps to benchmark",
+        )
+        parser.add_argument("--timeout", type=int, default=120)
+
+    def _run(self, path, timeout, options):
+        with Image.open(path) as img:
+            img.load()
+            started = time.perf_counter()
+            text = ocr._ocr_page(img, timeout, options)
+            return text, time.perf_counter() - started
+
+    def handle(self, *args, **options):
+        root = Path(options["fixture_dir"])
+        if not root.is_dir():
+            raise CommandError(f"{root} is not a directory")
+        cases = [
+            p
+            for p in sorted(root.iterdir())
+            if p.suffix.lower() in IMAGE_SUFFIXES and p.with_suffix(".txt").exists()
+        ]
+        if not cases:
+            raise CommandError("no image + .txt fixture pairs found")
+
+        steps = tuple(s for s in options["steps"].split(",") if s)
+        tuned = {**ocr.preprocess_options(), "steps": steps}
+        totals = {"raw_time": 0.0, "pre_time": 0.0, "raw_acc": 0.0, "pre_acc": 0.0}
+
+        self.stdout.write(
+            f"{'fixture':<30} {'raw s':>8} {'pre s':>8} {'raw acc':>8} {'pre acc':>8}"
+        )
+        for path in cases:
+            expected = path.with_suffix(".txt").read_text()
+            raw_text, raw_time = self._run(path, options["timeout"], None)
+            pre_text, pre_time = self._run(path, options["timeout"], tuned)
+            raw_acc = _accuracy(expected, raw_text)
+            pre_acc = _accuracy(expected, pre_text)
+            totals["raw_time"] += raw_time
+            totals["pre_time"] += pre_time
+            totals["raw_acc"] += raw_acc
+            totals["pre_acc"] += pre_acc
+            self.stdout.write(
+                f"{path.name:<30} {raw_time:>8.2f} {pre_time:>8.2f} "
+                f"{raw_acc:>8.3f} {pre_acc:>8.3f}"
+            )
+
+        n = len(cases)
+        self.stdout.write(
+            f"{'TOTAL / MEAN':<30} {totals['raw_time']:>8.2f} "
+            f"{totals['pre_time']:>8.2f} {totals['raw_acc'] / n:>8.3f} "
+            f"{totals['pre_acc'] / n:>8.3f}"
+        )
+        if totals["pre_time"]:
+            self.stdout.write(
+                f"speedup x{totals['raw_time'] / totals['pre_time']:.2f}, "
+                f"accuracy delta {(totals['pre_acc'] - totals['raw_acc']) / n:+.3f}"
+            )
@@ -0,0 +1,70 @@
+import multiprocessing
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from core.purches import po_numbers
+
+
+def _worker(args):
+    count, block_size = args
+    # never share the parent's connection across a fork
+    connections.close_all()
+    if block_size is not None:
+        settings.PO_NUMBER_BLOCK_SIZE = block_size
+    values = []
+    start = time.perf_counter()
+    for _ in range(count):
+        values.extend(po_numbers.allocate(1))
+    elapsed = time.perf_counter() - start
+    connections.close_all()
+    return values, elapsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Allocate PO sequence values from several processes at once and "
+        "report throughput and duplicates. Consumes real sequence values. "
+        "PostgreSQL only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=4)
+        parser.add_argument("--count", type=int, default=1000, help="per process")
+        parser.add_argument("--block-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        procs, count = options["processes"], options["count"]
+        if procs < 1 or count < 1:
+            raise CommandError("--processes and --count must be positive")
+        if connection.vendor != "postgresql":
+            # the counter-row fallback is for single-process use (dev, tests);
+            # forked writers on e.g. SQLite fail with "database is locked"
+            raise CommandError(
+                f"benchmark_po_numbers needs PostgreSQL, not {connection.vendor}"
+            )
+
+        connections.close_all()
+        ctx = multiprocessing.get_context("fork")
+        start = time.perf_counter()
+        with ctx.Pool(procs) as pool:
+            results = pool.map(_worker, [(count, options["block_size"])] * procs)
+        wall = time.perf_counter() - start
+
+        values = [v for vals, _ in results for v in vals]
+        dupes = len(values) - len(set(values))
+        per_proc = [count / elapsed for _, elapsed in results if elapsed]
+        self.stdout.write(
+            f"backend={connection.vendor} processes={procs} "
+            f"allocations={len(values)} block_size="
+            f"{options['block_size'] or getattr(settings, 'PO_NUMBER_BLOCK_SIZE', 20)}"
+        )
+        self.stdout.write(
+            f"wall={wall:.2f}s throughput={len(values) / wall:,.0f}/s "
+            f"per-process avg={sum(per_proc) / len(per_proc):,.0f}/s"
+        )
+        if dupes:
+            raise CommandError(f"{dupes} duplicate values allocated")
+        self.stdout.write(self.style.SUCCESS("no duplicates"))
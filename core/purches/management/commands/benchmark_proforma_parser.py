@@ -0,0 +1,122 @@
+import re
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from core.purches import extractors
+
+
+def _legacy_parse(text, tables):
+    """The pre-registry parser (inline regexes, per-cell header checks)."""
+    extracted = {}
+    m = re.search(r"Invoice\s*No[:\s]*([A-Za-z0-9\-\/]+)", text, re.I)
+    if m:
+        extracted["invoice_no"] = m.group(1).strip()
+    m = re.search(r"Total\s*[:\s]*\$?([\d,\.]+)", text, re.I)
+    if m:
+        extracted["total_amount"] = Decimal(m.group(1).replace(",", ""))
+
+    items = []
+    for t in tables:
+        headers = [c.strip().lower() if c else "" for c in t[0]]
+        for row in t[1:]:
+            name = None
+            qty = 1
+            unit = None
+            for idx, h in enumerate(headers):
+                cell = row[idx] if idx < len(row) else ""
+                if "description" in h or "item" in h or "name" in h:
+                    name = cell
+                if "qty" in h or "quantity" in h:
+                    try:
+                        qty = int(cell)
+                    except (ValueError, TypeError):
+                        qty = 1
+                if "price" in h or "unit" in h:
+                    try:
+                        unit = Decimal(cell.replace(",", "").replace("$", ""))
+                    except (ValueError, TypeError):
+                        unit = None
+            if name:
+                items.append({"name": name, "quantity": qty, "unit_price": unit})
+        if items:
+            break
+    extracted["items"] = items
+    return extracted
+
+
+def _registry_parse(text, tables):
+    extracted = {}
+    template = extractors.select_template(text)
+    template.match_header_fields(text, extracted)
+    items = []
+    for t in tables:
+        items = template.parse_table(t)
+        if items:
+            break
+    extracted["items"] = items
+    return extracted
+
+
+def _synthetic_document(tables, rows, columns):
+    text = "\n".join(
+        ["ACME Supplies Ltd", "Invoice No: INV-2024/77"]
+        + [f"Terms and conditions line {i}" for i in range(rows)]
+        + ["Total: $12,021.00"]
+    )
+    extra = [f"Note {c}" for c in range(max(columns - 5, 0))]
+    # side tables (bank details, delivery schedule...) without item columns
+    side = [["Field", "Value", *extra]] + [
+        [f"field {r}", f"value {r}", *["x"] * len(extra)] for r in range(rows)
+    ]
+    # no unit-of-measure column: the legacy parser crashes on "pcs"
+    lines = [["#", "Item Description", "Qty", "Unit Price", "Amount", *extra]]
+    lines += [
+        [
+            str(r),
+            f"thing {r}",
+            str(r % 7 + 1),
+            f"{r * 3.5:,.2f}",
+            "",
+            *[""] * len(extra),
+        ]
+        for r in range(rows)
+    ]
+    return text, [side] * (tables - 1) + [lines]
+
+
+class Command(BaseCommand):
+    help = "Compare per-document parse cost of the legacy and registry parsers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tables", type=int, default=10)
+        parser.add_argument("--rows", type=int, default=300)
+        parser.add_argument("--columns", type=int, default=12)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def _time(self, fn, text, tables, repeat):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            result = fn(text, tables)
+        return (time.perf_counter() - started) / repeat, result
+
+    def handle(self, *args, **options):
+        text, tables = _synthetic_document(
+            options["tables"], options["rows"], options["columns"]
+        )
+        legacy_s, legacy = self._time(_legacy_parse, text, tables, options["repeat"])
+        registry_s, registry = self._time(
+            _registry_parse, text, tables, options["repeat"]
+        )
+        if legacy != registry:
+            self.stderr.write(self.style.WARNING("parsers disagree on this document"))
+
+        self.stdout.write(
+            f"{options['tables']} tables x {options['rows']} rows x "
+            f"{options['columns']} columns, {options['repeat']} runs"
+        )
+        self.stdout.write(f"legacy:   {legacy_s * 1000:8.2f} ms/document")
+        self.stdout.write(f"registry: {registry_s * 1000:8.2f} ms/document")
+        if registry_s:
+            self.stdout.write(f"speedup:  x{legacy_s / registry_s:.2f}")
@@ -0,0 +1,113 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from core.purches.models import Approval, PurchaseOrder, PurchaseRequest, Receipt
+from core.purches.serializers.approval import (
+    MyApprovalRowSerializer,
+    MyApprovalSerializer,
+)
+from core.purches.serializers.purchase_order import (
+    PurchaseOrderRowSerializer,
+    PurchaseOrderSerializer,
+)
+from core.purches.serializers.purchase_request import (
+    PurchaseRequestRowSerializer,
+    PurchaseRequestSerializer,
+)
+from core.purches.serializers.receipt import ReceiptRowSerializer, ReceiptSerializer
+
+
+def cases():
+    """(label, queryset, ModelSerializer, ValuesSerializer) per list endpoint."""
+    return [
+        (
+            "purchase requests",
+            PurchaseRequest.objects.order_by("-created_at", "-id"),
+            PurchaseRequestSerializer,
+            PurchaseRequestRowSerializer,
+        ),
+        (
+            "purchase orders",
+            PurchaseOrder.objects.order_by("-generated_at", "-id"),
+            PurchaseOrderSerializer,
+            PurchaseOrderRowSerializer,
+        ),
+        (
+            "approvals",
+            Approval.objects.order_by("-created_at", "-id"),
+            MyApprovalSerializer,
+            MyApprovalRowSerializer,
+        ),
+        (
+            "receipts",
+            Receipt.objects.order_by("-uploaded_at", "-id"),
+            ReceiptSerializer,
+            ReceiptRowSerializer,
+        ),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the ModelSerializer and values() list paths per 1,000 rows over "
+        "existing data and check that both render the same JSON bytes. Lazy "
+        "per-page queries (items, legacy approvers) count as serialization."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def _model_path(self, qs, serializer_class):
+        start = time.perf_counter()
+        setup = getattr(serializer_class, "setup_eager_loading", None)
+        objs = list(setup(qs) if setup else qs.all())
+        fetched = time.perf_counter()
+        data = serializer_class(objs, many=True).data
+        return data, fetched - start, time.perf_counter() - fetched
+
+    def _values_path(self, qs, serializer_class):
+        start = time.perf_counter()
+        rows = list(qs.values(*serializer_class.columns()))
+        fetched = time.perf_counter()
+        data = serializer_class().to_representation(rows)
+        return data, fetched - start, time.perf_counter() - fetched
+
+    def handle(self, *args, **options):
+        limit, repeat = options["rows"], options["repeat"]
+        if limit < 1 or repeat < 1:
+            raise CommandError("--rows and --repeat must be positive")
+
+        renderer = JSONRenderer()
+        mismatches = []
+        self.stdout.write(
+            f"{'list':<18} {'rows':>5}  {'path':<6} "
+            f"{'fetch ms/1k':>11} {'serialize ms/1k':>15} {'total ms/1k':>11}"
+        )
+        for label, qs, model_serializer, row_serializer in cases():
+            qs = qs[:limit]
+            n = qs.count()
+            if not n:
+                self.stdout.write(f"{label:<18} {0:>5}  skipped (no rows)")
+                continue
+            for path, run, serializer_class in (
+                ("model", self._model_path, model_serializer),
+                ("values", self._values_path, row_serializer),
+            ):
+                runs = [run(qs, serializer_class) for _ in range(repeat)]
+                fetch = min(r[1] for r in runs) * 1000 * 1000 / n
+                serialize = min(r[2] for r in runs) * 1000 * 1000 / n
+                self.stdout.write(
+                    f"{label:<18} {n:>5}  {path:<6} {fetch:>11.1f} "
+                    f"{serialize:>15.1f} {fetch + serialize:>11.1f}"
+                )
+                if path == "model":
+                    expected = renderer.render(runs[0][0])
+                elif renderer.render(runs[0][0]) != expected:
+                    mismatches.append(label)
+
+        if mismatches:
+            raise CommandError(f"output differs for: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS("values() output is byte-identical"))
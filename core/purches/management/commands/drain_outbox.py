@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.purches import outbox
+
+
+class Command(BaseCommand):
+    help = "Process pending outbox events (PO generation after final approval)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--loop",
+            type=float,
+            default=None,
+            metavar="SECONDS",
+            help="keep draining, sleeping this long between passes",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed = outbox.drain(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"processed {processed} events"))
+            if options["loop"] is None:
+                return
+            time.sleep(options["loop"])
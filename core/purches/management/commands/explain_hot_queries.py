@@ -0,0 +1,110 @@
+import re
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.purches.serializers.purchase_request import PurchaseRequestRowSerializer
+from core.purches.utils import user_is_role
+from core.purches.views.approvals import MyApprovedRequestsView, MyRejectedRequestsView
+from core.purches.views.purchase_request_core import PurchaseRequestViewSet
+from core.users.models import UserRole
+
+# plan fragments that mean a full table scan, per backend
+SEQ_SCAN = {
+    "postgresql": re.compile(r"\bSeq Scan on (purches_\w+)"),
+    "sqlite": re.compile(r"\bSCAN (purches_\w+)\b(?! USING)"),
+}
+
+
+def _page(view, queryset):
+    """The query a view runs for its first list page."""
+    paginator = view.paginator
+    return paginator.page_queryset(queryset, view, paginator.page_size)
+
+
+def hot_queries(user):
+    """
+    First-page queries of the list and queue endpoints `user` can open, built
+    by the views themselves so a change there is what gets EXPLAINed.
+    """
+    request = Request(APIRequestFactory().get("/"))
+    request.user = user
+    role = user.role or ("superuser" if user.is_superuser else "none")
+
+    requests = PurchaseRequestViewSet(
+        request=request, format_kwarg=None, kwargs={}, action="list"
+    )
+    columns = PurchaseRequestRowSerializer.columns()
+    queries = {
+        f"requests ({role})": _page(
+            requests,
+            requests.filter_queryset(requests._scoped_queryset()).values(*columns),
+        ),
+    }
+    if any(user_is_role(user, r) for r in ("approver1", "approver2", "finance")):
+        queries[f"requests: pending ({role})"] = _page(
+            requests, requests._pending_queryset().values(*columns)
+        )
+
+    approved = MyApprovedRequestsView(request=request, format_kwarg=None, kwargs={})
+    queries[f"approvals: mine ({role})"] = _page(
+        approved,
+        approved.filter_queryset(approved.get_queryset()).values(
+            *approved.row_serializer.columns()
+        ),
+    )
+    rejected = MyRejectedRequestsView(request=request, kwargs={})
+    queries[f"approvals: mine rejected ({role})"] = _page(
+        rejected, rejected.get_queryset()
+    )
+    return queries
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the approval queue queries, as one user of each role and a "
+        "superuser, and report any that scan a purches table without an "
+        "index. The same check runs as a test on PostgreSQL "
+        "(core.purches.tests.test_query_plans)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true")
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        pattern = SEQ_SCAN.get(vendor)
+        if pattern is None:
+            raise CommandError(f"no plan checks for backend {vendor}")
+
+        User = get_user_model()
+        users = [
+            User.objects.filter(role=role).order_by("pk").first()
+            for role in UserRole.values
+        ]
+        users.append(User.objects.filter(is_superuser=True).order_by("pk").first())
+        users = [u for u in users if u is not None]
+        if not users:
+            raise CommandError("needs at least one user to build the queries")
+
+        # the same role may show up twice (a superuser is usually staff too)
+        queries = {}
+        for user in users:
+            for label, qs in hot_queries(user).items():
+                queries[f"{user.email}: {label}"] = qs
+        with transaction.atomic():
+            if vendor == "postgresql":
+                # small tables make seq scans cheapest; we only care that an
+                # index can serve each access path
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            for label, qs in queries.items():
+                plan = qs.explain()
+                scans = pattern.findall(plan)
+                status = "SEQ SCAN " + ", ".join(scans) if scans else "index"
+                self.stdout.write(f"{label:<64} {status}")
+                if options["verbose_plans"]:
+                    self.stdout.write(plan + "\n")
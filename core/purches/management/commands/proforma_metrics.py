@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core.purches import metrics, triage
+
+
+class Command(BaseCommand):
+    help = "Show how often proforma extraction took the text, OCR or hybrid path."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="zero the counters after printing"
+        )
+
+    def handle(self, *args, **options):
+        names = triage.route_metric_names()
+        for name, value in metrics.get_counts(names).items():
+            self.stdout.write(f"{name}: {value}")
+        if options["reset"]:
+            metrics.reset(names)
+            self.stdout.write(self.style.SUCCESS("counters reset"))
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.purches import extraction_cache
+from core.purches.services import extractor_version
+
+
+class Command(BaseCommand):
+    help = "Delete cached proforma extraction results."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=None,
+            help="only purge entries not used in this many days",
+        )
+        parser.add_argument(
+            "--stale-only",
+            action="store_true",
+            help="only purge entries from other extractor versions or settings",
+        )
+
+    def handle(self, *args, **options):
+        older_than = None
+        if options["older_than_days"] is not None:
+            older_than = timezone.now() - timedelta(days=options["older_than_days"])
+        keep_version = extractor_version() if options["stale_only"] else None
+
+        deleted = extraction_cache.purge(
+            older_than=older_than, keep_version=keep_version
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"purged {deleted} proforma cache entries")
+        )
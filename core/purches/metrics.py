@@ -0,0 +1,40 @@
+"""
+Operational counters stored in the database, so every web and worker process
+adds to (and `manage.py proforma_metrics` reads) the same values.
+"""
+
+import logging
+
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import F
+
+from core.purches.models import MetricCounter
+
+logger = logging.getLogger(__name__)
+
+
+def increment(name: str, value: int = 1) -> None:
+    """Bump a named counter; never raises."""
+    try:
+        counter = MetricCounter.objects.filter(name=name)
+        if counter.update(value=F("value") + value):
+            return
+        try:
+            with transaction.atomic():
+                MetricCounter.objects.create(name=name, value=value)
+        except IntegrityError:
+            # created concurrently by another process
+            counter.update(value=F("value") + value)
+    except DatabaseError as exc:
+        logger.warning("failed to record metric %s: %s", name, exc)
+
+
+def get_counts(names) -> dict:
+    found = dict(
+        MetricCounter.objects.filter(name__in=list(names)).values_list("name", "value")
+    )
+    return {name: int(found.get(name) or 0) for name in names}
+
+
+def reset(names) -> None:
+    MetricCounter.objects.filter(name__in=list(names)).delete()
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-17 14:53
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("purches", "0005_proformajob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProformaExtractionCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("digest", models.CharField(max_length=64)),
+                ("extractor_version", models.CharField(max_length=20)),
+                (
+                    "extracted",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                ("hits", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "last_used_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("digest", "extractor_version")},
+            },
+        ),
+    ]
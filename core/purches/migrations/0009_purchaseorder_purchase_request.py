@@ -0,0 +1,80 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def _pr_id_from_data(data):
+    # same lookup as serializers.purchase_order_utils.extract_pr_id_from_data
+    if not isinstance(data, dict):
+        return None
+    for source in (data, data.get("data")):
+        if not isinstance(source, dict):
+            continue
+        for key in ("purchase_request_id", "purchase_request", "id"):
+            val = source.get(key)
+            if isinstance(val, int):
+                return val
+    return None
+
+
+def _link_batch(PurchaseOrder, PurchaseRequest, pos):
+    # the PR -> PO one-to-one is authoritative where it is set
+    linked = dict(
+        PurchaseRequest.objects.filter(
+            purchase_order_id__in=[po.id for po in pos]
+        ).values_list("purchase_order_id", "id")
+    )
+    wanted = {po.id: linked.get(po.id) or _pr_id_from_data(po.data) for po in pos}
+    known = set(
+        PurchaseRequest.objects.filter(
+            id__in=[v for v in wanted.values() if v]
+        ).values_list("id", flat=True)
+    )
+    changed = []
+    for po in pos:
+        if wanted[po.id] in known:
+            po.purchase_request_id = wanted[po.id]
+            changed.append(po)
+    PurchaseOrder.objects.bulk_update(changed, ["purchase_request"])
+
+
+def backfill_purchase_request(apps, schema_editor):
+    PurchaseOrder = apps.get_model("purches", "PurchaseOrder")
+    PurchaseRequest = apps.get_model("purches", "PurchaseRequest")
+
+    batch = []
+    for po in (
+        PurchaseOrder.objects.filter(purchase_request__isnull=True)
+        .only("id", "data")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        batch.append(po)
+        if len(batch) >= BATCH_SIZE:
+            _link_batch(PurchaseOrder, PurchaseRequest, batch)
+            batch = []
+    if batch:
+        _link_batch(PurchaseOrder, PurchaseRequest, batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("purches", "0008_outboxevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="purchaseorder",
+            name="purchase_request",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="purchase_orders",
+                to="purches.purchaserequest",
+            ),
+        ),
+        migrations.RunPython(backfill_purchase_request, migrations.RunPython.noop),
+    ]
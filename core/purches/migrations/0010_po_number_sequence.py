@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:10
+
+from django.db import migrations, models
+
+SEQUENCE = "purches_po_number_seq"
+
+
+def create_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"CREATE SEQUENCE IF NOT EXISTS {SEQUENCE}")
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP SEQUENCE IF EXISTS {SEQUENCE}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("purches", "0009_purchaseorder_purchase_request"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PONumberCounter",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=32, primary_key=True, serialize=False),
+                ),
+                ("next_value", models.BigIntegerField(default=1)),
+            ],
+        ),
+        migrations.RunPython(create_sequence, drop_sequence),
+    ]
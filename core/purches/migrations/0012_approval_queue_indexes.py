@@ -0,0 +1,54 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("purches", "0011_purchaseorder_approver_snapshot"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="approval",
+            index=models.Index(
+                fields=["approver", "-created_at", "-id"],
+                name="approval_approver_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="approval",
+            index=models.Index(
+                condition=models.Q(("decision", "REJECTED")),
+                fields=["approver", "-created_at", "-id"],
+                name="approval_rejected_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="purchaserequest",
+            index=models.Index(
+                fields=["created_by", "-created_at", "-id"],
+                name="pr_creator_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="purchaserequest",
+            index=models.Index(
+                fields=["status", "-created_at", "-id"], name="pr_status_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="purchaserequest",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["current_approval_level", "-created_at", "-id"],
+                name="pr_pending_level_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="purchaserequest",
+            index=models.Index(fields=["-created_at", "-id"], name="pr_created_idx"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-17 15:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("purches", "0012_approval_queue_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MetricCounter",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("value", models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
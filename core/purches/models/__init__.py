@@ -1,7 +1,25 @@
 from .approval import Approval
+from .metric_counter import MetricCounter
+from .outbox_event import OutboxEvent
+from .po_number_counter import PONumberCounter
+from .proforma_cache import ProformaExtractionCache
+from .proforma_job import ProformaJob
 from .purchase_order import PurchaseOrder
+from .purchase_order_item import PurchaseOrderItem
 from .purchase_request import PurchaseRequest
 from .receipt import Receipt
 from .request_item import RequestItem
 
-__all__ = ["PurchaseRequest", "RequestItem", "Approval", "PurchaseOrder", "Receipt"]
+__all__ = [
+    "PurchaseRequest",
+    "RequestItem",
+    "Approval",
+    "PurchaseOrder",
+    "PurchaseOrderItem",
+    "Receipt",
+    "ProformaJob",
+    "ProformaExtractionCache",
+    "OutboxEvent",
+    "PONumberCounter",
+    "MetricCounter",
+]
@@ -19,3 +19,15 @@ class Approval(models.Model):
 
     class Meta:
         unique_together = ("purchase_request", "approver", "level")
+        indexes = [
+            # "my approvals" and "my rejections", newest first
+            models.Index(
+                fields=["approver", "-created_at", "-id"],
+                name="approval_approver_created_idx",
+            ),
+            models.Index(
+                fields=["approver", "-created_at", "-id"],
+                name="approval_rejected_idx",
+                condition=models.Q(decision="REJECTED"),
+            ),
+        ]
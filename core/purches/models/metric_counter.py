@@ -0,0 +1,11 @@
+from django.db import models
+
+
+class MetricCounter(models.Model):
+    """Named counter shared by every process, e.g. proforma route decisions."""
+
+    name = models.CharField(max_length=64, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}={self.value}"
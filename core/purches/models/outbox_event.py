@@ -0,0 +1,25 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class OutboxEvent(models.Model):
+    """
+    Side effect recorded in the same transaction as the change that caused
+    it and carried out afterwards by core.purches.outbox.drain.
+    """
+
+    class Topic(models.TextChoices):
+        CREATE_PURCHASE_ORDER = "purchase_order.create"
+
+    topic = models.CharField(max_length=64, choices=Topic.choices)
+    # one event per logical side effect, e.g. "purchase_order:<pr id>"
+    dedup_key = models.CharField(max_length=128, unique=True)
+    payload = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    def __str__(self):
+        return f"OutboxEvent {self.topic} {self.dedup_key}"
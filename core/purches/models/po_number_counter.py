@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class PONumberCounter(models.Model):
+    """
+    Next PO sequence value, used on databases without native sequences.
+    PostgreSQL uses the purches_po_number_seq sequence instead.
+    """
+
+    name = models.CharField(max_length=32, primary_key=True)
+    next_value = models.BigIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.name}={self.next_value}"
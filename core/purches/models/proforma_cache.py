@@ -0,0 +1,21 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+
+class ProformaExtractionCache(models.Model):
+    """Extraction results keyed by sha256 of the file bytes + extractor version."""
+
+    digest = models.CharField(max_length=64)
+    extractor_version = models.CharField(max_length=20)
+    # extracted dict; Decimals are stored as strings
+    extracted = models.JSONField(encoder=DjangoJSONEncoder)
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        unique_together = ("digest", "extractor_version")
+
+    def __str__(self):
+        return f"{self.digest[:12]}@{self.extractor_version}"
@@ -1,11 +1,40 @@
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
 
 class PurchaseOrder(models.Model):
     po_number = models.CharField(max_length=80, unique=True)
+    # the request this PO was generated for; also kept in `data` for old clients
+    purchase_request = models.ForeignKey(
+        "purches.PurchaseRequest",
+        null=True,
+        blank=True,
+        related_name="purchase_orders",
+        on_delete=models.SET_NULL,
+    )
     data = models.JSONField(default=dict, blank=True)
+    # approver snapshot taken when the PO is generated; names are copied so
+    # reads need no join and keep the name as it was at approval time
+    approved_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        related_name="approved_purchase_orders",
+        on_delete=models.SET_NULL,
+    )
+    approver_first_name = models.CharField(max_length=150, blank=True)
+    approver_last_name = models.CharField(max_length=150, blank=True)
     generated_at = models.DateTimeField(default=timezone.now)
 
+    @property
+    def approver_full_name(self):
+        return f"{self.approver_first_name} {self.approver_last_name}".strip()
+
+    def set_approver(self, user):
+        self.approved_by = user
+        self.approver_first_name = getattr(user, "first_name", "") or ""
+        self.approver_last_name = getattr(user, "last_name", "") or ""
+
     def __str__(self):
         return self.po_number
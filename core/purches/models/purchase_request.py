@@ -29,5 +29,26 @@ class PurchaseRequest(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # matched to the list/queue access paths, all keyset-ordered on
+        # (created_at, id): per creator, per status, and the pending queue
+        # per approval level
+        indexes = [
+            models.Index(
+                fields=["created_by", "-created_at", "-id"],
+                name="pr_creator_created_idx",
+            ),
+            models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="pr_status_created_idx",
+            ),
+            models.Index(
+                fields=["current_approval_level", "-created_at", "-id"],
+                name="pr_pending_level_idx",
+                condition=models.Q(status="PENDING"),
+            ),
+            models.Index(fields=["-created_at", "-id"], name="pr_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.title} ({self.status})"
@@ -0,0 +1,149 @@
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pypdfium2 as pdfium
+import pytesseract
+from django.conf import settings
+from PIL import Image, ImageSequence
+
+from . import ocr_preprocess
+
+logger = logging.getLogger(__name__)
+
+# pages already run in parallel; stop each tesseract from also spawning a
+# thread per core, which oversubscribes the box
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _ocr_workers() -> int:
+    return int(getattr(settings, "PROFORMA_OCR_WORKERS", None) or os.cpu_count() or 1)
+
+
+def _get_executor():
+    """
+    Shared pool, created lazily per process. tesseract itself runs as a child
+    process, so a thread pool already spreads pages across cores; "process"
+    also moves image decoding off this interpreter. Daemonic processes (e.g.
+    celery prefork children) cannot fork a process pool and use threads.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            kind = getattr(settings, "PROFORMA_OCR_EXECUTOR", "thread")
+            workers = _ocr_workers()
+            if kind == "process" and not multiprocessing.current_process().daemon:
+                _executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                _executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="ocr"
+                )
+        return _executor
+
+
+def is_pdf(file_obj) -> bool:
+    file_obj.seek(0)
+    head = file_obj.read(5)
+    file_obj.seek(0)
+    return head == b"%PDF-"
+
+
+def _iter_page_images(file_obj, dpi, pages=None):
+    """
+    Yield one PIL image per page: rasterized PDF pages or image frames.
+    `pages` optionally restricts PDFs to these 0-based page indexes.
+    """
+    file_obj.seek(0)
+    if is_pdf(file_obj):
+        doc = pdfium.PdfDocument(file_obj.read())
+        try:
+            indexes = range(len(doc)) if pages is None else sorted(pages)
+            for index in indexes:
+                page = doc[index]
+                try:
+                    bitmap = page.render(scale=dpi / 72)
+                    yield bitmap.to_pil()
+                finally:
+                    page.close()
+        finally:
+            doc.close()
+        return
+
+    img = Image.open(file_obj)
+    for frame in ImageSequence.Iterator(img):
+        yield frame.copy()
+
+
+def preprocess_options() -> dict:
+    """Read preprocessing settings here; pool workers may not have settings."""
+    return {
+        "steps": tuple(
+            getattr(settings, "PROFORMA_OCR_PREPROCESS", ocr_preprocess.STEPS)
+        ),
+        "target_dpi": int(getattr(settings, "PROFORMA_OCR_DPI", 300)),
+        "max_side": int(getattr(settings, "PROFORMA_OCR_MAX_SIDE", 3600)),
+        "max_skew": float(getattr(settings, "PROFORMA_OCR_MAX_SKEW", 5.0)),
+    }
+
+
+def _ocr_page(image, timeout, options=None):
+    if isinstance(image, bytes):
+        image = Image.open(io.BytesIO(image))
+    config = ""
+    if options and options.get("steps"):
+        image = ocr_preprocess.preprocess(image, options)
+        if "normalize_dpi" in options["steps"]:
+            config = f"--dpi {options['target_dpi']}"
+    return pytesseract.image_to_string(image, config=config, timeout=timeout)
+
+
+def _to_png(image) -> bytes:
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def ocr_document(file_obj, pages=None) -> str:
+    """
+    OCR every page of a scanned PDF or (multi-frame) image in parallel and
+    return the page texts joined in page order. A page that exceeds
+    PROFORMA_OCR_PAGE_TIMEOUT contributes an empty string. `pages` limits a
+    PDF to the given 0-based page indexes.
+    """
+    dpi = int(getattr(settings, "PROFORMA_OCR_DPI", 300))
+    timeout = int(getattr(settings, "PROFORMA_OCR_PAGE_TIMEOUT", 60))
+    options = preprocess_options()
+    executor = _get_executor()
+    # process pools need picklable input; threads can share the image
+    as_bytes = isinstance(executor, ProcessPoolExecutor)
+    # keep a bounded number of rendered pages in flight
+    window = _ocr_workers() * 2
+
+    futures = []
+    texts = []
+
+    def _collect(upto):
+        while len(texts) < upto:
+            page_number = len(texts) + 1
+            try:
+                texts.append(futures[len(texts)].result())
+            except RuntimeError as exc:
+                # timeouts and tesseract errors both surface as RuntimeError
+                logger.warning("OCR failed on page %s: %s", page_number, exc)
+                texts.append("")
+            futures[page_number - 1] = None
+
+    for image in _iter_page_images(file_obj, dpi, pages=pages):
+        payload = _to_png(image) if as_bytes else image
+        futures.append(executor.submit(_ocr_page, payload, timeout, options))
+        _collect(len(futures) - window)
+    _collect(len(futures))
+
+    logger.debug("OCR finished pages=%s", len(texts))
+    return "\n".join(texts)
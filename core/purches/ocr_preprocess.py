@@ -0,0 +1,145 @@
+"""
+Image clean-up run before tesseract. Every step takes and returns a PIL
+image; `preprocess` runs the configured steps in pipeline order.
+"""
+
+from PIL import Image, ImageOps
+
+STEPS = ("normalize_dpi", "grayscale", "deskew", "binarize", "crop_margins")
+
+DEFAULT_OPTIONS = {
+    "steps": STEPS,
+    "target_dpi": 300,
+    # a little over the long side of an A4 page at 300 dpi
+    "max_side": 3600,
+    "max_skew": 5.0,
+    "skew_step": 0.5,
+    "margin": 10,
+}
+
+
+def normalize_dpi(img, target_dpi=300, max_side=3600, **_):
+    """
+    Apply EXIF rotation and downscale oversized images (e.g. 12 MP phone
+    photos) to roughly target_dpi.
+    """
+    img = ImageOps.exif_transpose(img)
+    dpi = img.info.get("dpi", (0, 0))[0] or 0
+    scale = 1.0
+    if dpi > target_dpi:
+        scale = target_dpi / float(dpi)
+    long_side = max(img.size)
+    if long_side * scale > max_side:
+        scale = max_side / float(long_side)
+    if scale < 1.0:
+        size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
+def grayscale(img, **_):
+    if img.mode == "L":
+        return img
+    return img.convert("L")
+
+
+def _row_profile_score(img):
+    # squash every row to one pixel; aligned text lines give sharp steps
+    rows = list(img.resize((1, img.height), Image.Resampling.BOX).getdata())
+    return sum((a - b) ** 2 for a, b in zip(rows, rows[1:]))
+
+
+def deskew(img, max_skew=5.0, skew_step=0.5, **_):
+    """Rotate by the angle whose horizontal projection is sharpest."""
+    if max_skew <= 0:
+        return img
+    gray = grayscale(img)
+    small = gray.copy()
+    small.thumbnail((800, 800))
+    small = ImageOps.invert(small)
+    best_angle, best_score = 0.0, _row_profile_score(small)
+    steps = int(max_skew / skew_step)
+    for i in range(-steps, steps + 1):
+        angle = i * skew_step
+        if angle == 0:
+            continue
+        score = _row_profile_score(
+            small.rotate(angle, resample=Image.Resampling.BILINEAR, fillcolor=0)
+        )
+        if score > best_score:
+            best_angle, best_score = angle, score
+    if best_angle == 0.0:
+        return img
+    return gray.rotate(
+        best_angle,
+        resample=Image.Resampling.BILINEAR,
+        expand=True,
+        fillcolor=255,
+    )
+
+
+def _otsu_threshold(img):
+    hist = img.histogram()[:256]
+    total = sum(hist)
+    sum_all = sum(i * h for i, h in enumerate(hist))
+    sum_bg = weight_bg = 0
+    best_var, threshold = 0.0, 127
+    for i, h in enumerate(hist):
+        weight_bg += h
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += i * h
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if between > best_var:
+            best_var, threshold = between, i
+    return threshold
+
+
+def binarize(img, **_):
+    gray = grayscale(img)
+    threshold = _otsu_threshold(gray)
+    return gray.point(lambda p: 255 if p > threshold else 0, mode="L")
+
+
+def crop_margins(img, margin=10, **_):
+    gray = grayscale(img)
+    ink = gray.point(lambda p: 255 if p < 128 else 0, mode="L")
+    bbox = ink.getbbox()
+    if not bbox:
+        return img
+    x0, y0, x1, y1 = bbox
+    return gray.crop(
+        (
+            max(0, x0 - margin),
+            max(0, y0 - margin),
+            min(gray.width, x1 + margin),
+            min(gray.height, y1 + margin),
+        )
+    )
+
+
+_STEP_FUNCS = {
+    "normalize_dpi": normalize_dpi,
+    "grayscale": grayscale,
+    "deskew": deskew,
+    "binarize": binarize,
+    "crop_margins": crop_margins,
+}
+
+
+def preprocess(img, options=None):
+    """Run the enabled steps, always in pipeline order."""
+    opts = {**DEFAULT_OPTIONS, **(options or {})}
+    enabled = set(opts["steps"])
+    unknown = enabled - set(STEPS)
+    if unknown:
+        raise ValueError(f"unknown OCR preprocess steps: {sorted(unknown)}")
+    for name in STEPS:
+        if name in enabled:
+            img = _STEP_FUNCS[name](img, **opts)
+    return img
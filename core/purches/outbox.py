@@ -0,0 +1,184 @@
+"""
+Transactional outbox for work that must follow a committed change but should
+not run inside the request that made it (currently: PO generation on final
+approval). Events are written in the caller's transaction and drained by the
+``purches.drain_outbox`` task once it commits; with an eager Celery config
+the drain runs in-process right after the commit. Celery beat also runs the
+drain periodically, which picks up events whose enqueue was lost.
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, prefetch_related_objects
+from django.utils import timezone
+
+from core.purches.models import OutboxEvent, PurchaseOrder, PurchaseRequest
+
+from .po import create_purchase_orders_for_requests
+
+logger = logging.getLogger(__name__)
+
+CREATE_PURCHASE_ORDER = OutboxEvent.Topic.CREATE_PURCHASE_ORDER
+
+
+def purchase_order_key(pr_id) -> str:
+    return f"purchase_order:{pr_id}"
+
+
+def _enqueue_drain():
+    from .tasks import drain_outbox
+
+    try:
+        drain_outbox.delay()
+    except Exception as exc:
+        # the events are committed; the periodic drain will process them
+        logger.warning("could not enqueue outbox drain: %s", exc)
+
+
+def _schedule_drain():
+    transaction.on_commit(_enqueue_drain)
+
+
+def record_many(events) -> None:
+    """
+    Record (topic, dedup_key, payload) events in the current transaction.
+    Keys that already have an event are ignored, so recording is idempotent.
+    """
+    rows = [
+        OutboxEvent(topic=topic, dedup_key=key, payload=payload or {})
+        for topic, key, payload in events
+    ]
+    if not rows:
+        return
+    OutboxEvent.objects.bulk_create(rows, ignore_conflicts=True)
+    _schedule_drain()
+
+
+def record(topic, dedup_key, payload=None) -> None:
+    record_many([(topic, dedup_key, payload)])
+
+
+def request_purchase_order(pr, approver=None) -> None:
+    # lets the post_save safety net skip this instance's save
+    pr._purchase_order_requested = True
+    record(
+        CREATE_PURCHASE_ORDER,
+        purchase_order_key(pr.pk),
+        {"purchase_request_id": pr.pk, "approver_id": getattr(approver, "pk", None)},
+    )
+
+
+def _create_purchase_orders(events) -> None:
+    """Create the POs for a batch of events; requests that have one are skipped."""
+    pr_ids = [e.payload.get("purchase_request_id") for e in events]
+    prs = list(
+        PurchaseRequest.objects.select_for_update()
+        .filter(pk__in=pr_ids, purchase_order__isnull=True)
+        .order_by("pk")
+    )
+    if not prs:
+        return
+
+    # a PO generated earlier but never attached is reused, not duplicated
+    orphans = {}
+    for po in PurchaseOrder.objects.filter(
+        purchase_request__in=prs, purchaserequest__isnull=True
+    ).order_by("pk"):
+        orphans.setdefault(po.purchase_request_id, po)
+    for pr in prs:
+        if pr.pk in orphans:
+            pr.purchase_order = orphans[pr.pk]
+    missing = [pr for pr in prs if pr.pk not in orphans]
+
+    approver_ids = {
+        e.payload.get("purchase_request_id"): e.payload.get("approver_id")
+        for e in events
+    }
+    users = get_user_model().objects.in_bulk(
+        [uid for uid in approver_ids.values() if uid]
+    )
+    prefetch_related_objects(missing, "items")
+
+    # group by approver so each group is one bulk insert
+    by_approver = {}
+    for pr in missing:
+        by_approver.setdefault(approver_ids.get(pr.pk), []).append(pr)
+    for approver_id, group in by_approver.items():
+        pos = create_purchase_orders_for_requests(
+            group, created_by=users.get(approver_id)
+        )
+        for pr, po in zip(group, pos):
+            pr.purchase_order = po
+    PurchaseRequest.objects.bulk_update(prs, ["purchase_order"])
+
+
+HANDLERS = {
+    CREATE_PURCHASE_ORDER: _create_purchase_orders,
+}
+
+
+def _run(topic, events) -> None:
+    with transaction.atomic():
+        HANDLERS[topic](events)
+        OutboxEvent.objects.filter(pk__in=[e.pk for e in events]).update(
+            processed_at=timezone.now()
+        )
+
+
+def _fail(events, exc) -> None:
+    OutboxEvent.objects.filter(pk__in=[e.pk for e in events]).update(
+        attempts=F("attempts") + 1, last_error=str(exc)[:2000]
+    )
+
+
+def drain(batch_size=None) -> int:
+    """
+    Process pending events in batches until none are left. Returns the number
+    processed. Safe to run from several workers at once: each batch is
+    claimed with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+    if batch_size is None:
+        batch_size = int(getattr(settings, "OUTBOX_DRAIN_BATCH_SIZE", 100))
+    max_attempts = int(getattr(settings, "OUTBOX_MAX_ATTEMPTS", 5))
+
+    done = 0
+    failed = set()  # don't retry within the same drain
+    while True:
+        with transaction.atomic():
+            events = list(
+                OutboxEvent.objects.select_for_update(skip_locked=True)
+                .filter(processed_at__isnull=True, attempts__lt=max_attempts)
+                .exclude(pk__in=failed)
+                .order_by("pk")[:batch_size]
+            )
+            if not events:
+                return done
+
+            by_topic = {}
+            for e in events:
+                by_topic.setdefault(e.topic, []).append(e)
+            for topic, group in by_topic.items():
+                if topic not in HANDLERS:
+                    logger.error("no outbox handler for topic=%s", topic)
+                    _fail(group, f"unknown topic {topic}")
+                    failed.update(e.pk for e in group)
+                    continue
+                try:
+                    _run(topic, group)
+                    done += len(group)
+                except Exception:
+                    # retry one at a time so a single bad event can't block
+                    # the rest of its batch
+                    for e in group:
+                        try:
+                            _run(topic, [e])
+                            done += 1
+                        except Exception as exc:
+                            logger.exception(
+                                "outbox event %s (%s) failed: %s", e.pk, topic, exc
+                            )
+                            _fail([e], exc)
+                            failed.add(e.pk)
@@ -0,0 +1,205 @@
+"""
+Keyset (cursor) pagination on a composite key such as (created_at, id).
+
+Pages are selected with a WHERE on the last row seen instead of an OFFSET,
+so page 500 costs the same as page one and rows inserted meanwhile don't
+shift later pages. Cursors are opaque base64 tokens.
+"""
+
+import base64
+import json
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    # the last field must be unique (normally "id"); views override this
+    # with a `keyset_ordering` attribute
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.page_size = getattr(settings, "REST_FRAMEWORK", {}).get("PAGE_SIZE") or 50
+        self.next_cursor = None
+        self.previous_cursor = None
+        self.base_url = None
+
+    # cursor encoding
+
+    def _encode(self, values, reverse):
+        raw = json.dumps({"v": values, "r": int(reverse)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def _decode(self, token, fields, model):
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            values, reverse = raw["v"], bool(raw.get("r"))
+            if len(values) != len(fields):
+                raise ValueError("cursor does not match ordering")
+            values = [
+                model._meta.get_field(name).to_python(value)
+                for name, value in zip(fields, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    @staticmethod
+    def _position(obj, fields):
+        out = []
+        for name in fields:
+            # rows may be model instances or values() dicts
+            value = obj[name] if isinstance(obj, dict) else getattr(obj, name)
+            out.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        return out
+
+    # paging
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, "keyset_ordering", None) or self.ordering)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, ""))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    @staticmethod
+    def _after(fields, descending, values):
+        """Q for rows strictly after `values` in the given ordering."""
+        clauses = []
+        for i, (name, desc) in enumerate(zip(fields, descending)):
+            cond = {f: v for f, v in zip(fields[:i], values[:i])}
+            cond[f"{name}__{'lt' if desc else 'gt'}"] = values[i]
+            clauses.append(Q(**cond))
+        return reduce(or_, clauses)
+
+    def page_queryset(self, queryset, view, page_size, values=None, reverse=False):
+        """
+        The query behind one page: keyset order, the cursor condition and
+        one row past the page so the next link can be decided.
+        """
+        ordering = self.get_ordering(view)
+        fields = [o.lstrip("-") for o in ordering]
+        descending = [o.startswith("-") for o in ordering]
+        # walking backwards is walking forwards in the flipped ordering
+        direction = [d != reverse for d in descending]
+        qs = queryset.order_by(
+            *[("-" if d else "") + f for f, d in zip(fields, direction)]
+        )
+        if values is not None:
+            qs = qs.filter(self._after(fields, direction, values))
+        return qs[: page_size + 1]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+
+        fields = [o.lstrip("-") for o in self.get_ordering(view)]
+        token = request.query_params.get(self.cursor_query_param)
+        values, reverse = (None, False)
+        if token:
+            values, reverse = self._decode(token, fields, queryset.model)
+
+        qs = self.page_queryset(queryset, view, page_size, values, reverse)
+        rows = list(qs)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else values is not None
+        self.next_cursor = (
+            self._encode(self._position(rows[-1], fields), False)
+            if has_next and rows
+            else None
+        )
+        self.previous_cursor = (
+            self._encode(self._position(rows[0], fields), True)
+            if has_previous and rows
+            else None
+        )
+        return rows
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        return self._link(self.next_cursor)
+
+    def get_previous_link(self):
+        return self._link(self.previous_cursor)
+
+    def get_links(self) -> dict:
+        return {"next": self.get_next_link(), "previous": self.get_previous_link()}
+
+    def get_paginated_response(self, data):
+        return Response({**self.get_links(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPaginationMixin:
+    """
+    Keyset pagination for plain APIViews that return {key: [...]} bodies:
+    the rows stay under their existing key and next/previous are added.
+    """
+
+    pagination_class = KeysetPagination
+    keyset_ordering = ("-created_at", "-id")
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            self._paginator = self.pagination_class()
+        return self._paginator
+
+    def paginate_queryset(self, queryset):
+        return self.paginator.paginate_queryset(queryset, self.request, view=self)
+
+    def paginated_payload(self, key, data) -> dict:
+        return {key: data, **self.paginator.get_links()}
+
+
+class RowListMixin:
+    """
+    list() for generic views whose pages are serialized from values() rows
+    by `row_serializer` (a ValuesSerializer) instead of the ModelSerializer.
+    """
+
+    row_serializer = None
+
+    def list_rows(self, queryset):
+        rows = queryset.values(*self.row_serializer.columns())
+        page = self.paginate_queryset(rows)
+        serializer = self.row_serializer(self.get_serializer_context())
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(rows))
+
+    def list(self, request, *args, **kwargs):
+        return self.list_rows(self.filter_queryset(self.get_queryset()))
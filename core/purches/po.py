@@ -1,21 +1,12 @@
 import logging
 
-from django.db import IntegrityError, transaction
 from django.utils import timezone
-from django.utils.crypto import get_random_string
 
 from core.purches.models import PurchaseOrder, PurchaseRequest
 
-logger = logging.getLogger(__name__)
-
+from . import po_numbers
 
-def _generate_po_number(pr: PurchaseRequest | None = None) -> str:
-    ts = timezone.now().strftime("%Y%m%d%H%M%S")
-    base = f"PO-{ts}"
-    if pr is not None and getattr(pr, "id", None) is not None:
-        base = f"PO-{pr.id}-{ts}"
-    rand = get_random_string(6).upper()
-    return f"{base}-{rand}"
+logger = logging.getLogger(__name__)
 
 
 def _serialize_pr(pr: PurchaseRequest) -> dict:
@@ -72,41 +63,33 @@ def _serialize_pr(pr: PurchaseRequest) -> dict:
     return data
 
 
-def create_purchase_order_for_request(
-    pr: PurchaseRequest, created_by=None
-) -> PurchaseOrder:
-    """
-    Create and return a PurchaseOrder for the given PurchaseRequest.
-    Always returns the created PurchaseOrder or raises.
-    """
-    logger.debug(
-        "create_purchase_order_for_request called for pr=%s by=%s",
-        getattr(pr, "id", None),
-        getattr(created_by, "id", None),
-    )
-    data = _serialize_pr(pr)
-
-    # embed approver info into data (like title) when available
-    approver_user = None
+def _resolve_approver(pr: PurchaseRequest, created_by=None):
+    """The approving user: `created_by` if given, else the latest approval."""
     if created_by is not None:
-        approver_user = created_by
-    else:
-        # fallback: try to read latest APPROVED approval for this PR
-        try:
-            from core.purches.models import Approval
-
-            approval = (
-                Approval.objects.filter(
-                    purchase_request=pr, decision=Approval.Decision.APPROVED
-                )
-                .order_by("-level", "-created_at")
-                .first()
+        return created_by
+    try:
+        from core.purches.models import Approval
+
+        approval = (
+            Approval.objects.filter(
+                purchase_request=pr, decision=Approval.Decision.APPROVED
             )
-            if approval:
-                approver_user = getattr(approval, "approver", None)
-        except Exception:
-            approver_user = None
+            .select_related("approver")
+            .order_by("-level", "-created_at")
+            .first()
+        )
+        if approval:
+            return getattr(approval, "approver", None)
+    except Exception:
+        return None
+    return None
 
+
+def _build_po_data(pr: PurchaseRequest, approver_user=None) -> dict:
+    """PurchaseOrder.data for `pr`, with the approver embedded when known."""
+    data = _serialize_pr(pr)
+
+    # embed approver info into data (like title) when available
     if approver_user:
         approver_info = {
             "id": getattr(approver_user, "id", None),
@@ -117,52 +100,64 @@ def create_purchase_order_for_request(
             f"{approver_info['first_name']} {approver_info['last_name']}".strip()
         )
         data["approver"] = approver_info
+    return data
+
+
+def _new_purchase_order(pr, po_number, generated_at, created_by=None):
+    approver_user = _resolve_approver(pr, created_by)
+    po = PurchaseOrder(
+        po_number=po_number,
+        purchase_request=pr,
+        data=_build_po_data(pr, approver_user),
+        generated_at=generated_at,
+    )
+    if approver_user is not None:
+        po.set_approver(approver_user)
+    return po
+
+
+def create_purchase_order_for_request(
+    pr: PurchaseRequest, created_by=None
+) -> PurchaseOrder:
+    """
+    Create and return a PurchaseOrder for the given PurchaseRequest.
+    Always returns the created PurchaseOrder or raises.
+    """
+    logger.debug(
+        "create_purchase_order_for_request called for pr=%s by=%s",
+        getattr(pr, "id", None),
+        getattr(created_by, "id", None),
+    )
+    po = _new_purchase_order(
+        pr, po_numbers.next_po_number(), timezone.now(), created_by=created_by
+    )
+    po.save(force_insert=True)
+    logger.info(
+        "PurchaseOrder created id=%s po_number=%s for pr=%s",
+        po.id,
+        po.po_number,
+        getattr(pr, "id", None),
+    )
+    return po
 
-    # try multiple times to avoid po_number collision
-    last_exc = None
-    for _ in range(5):
-        po_number = _generate_po_number(pr)
-        try:
-            with transaction.atomic():
-                # try to attach FK if model has purchase_request field
-                try:
-                    po = PurchaseOrder.objects.create(
-                        po_number=po_number,
-                        data=data,
-                        generated_at=timezone.now(),
-                        purchase_request=pr,
-                    )
-                except TypeError:
-                    po = PurchaseOrder.objects.create(
-                        po_number=po_number,
-                        data=data,
-                        generated_at=timezone.now(),
-                    )
-                logger.info(
-                    "PurchaseOrder created id=%s po_number=%s for pr=%s",
-                    po.id,
-                    po.po_number,
-                    getattr(pr, "id", None),
-                )
-                return po
-        except IntegrityError as e:
-            logger.warning(
-                "PO number collision retrying po_number=%s (%s)", po_number, e
-            )
-            last_exc = e
-        except Exception as e:
-            logger.exception(
-                "Unexpected error creating PO for pr=%s: %s", getattr(pr, "id", None), e
-            )
-            last_exc = e
-            break
-
-    if last_exc:
-        logger.error(
-            "Failed to create PurchaseOrder for pr=%s after retries: %s",
-            getattr(pr, "id", None),
-            last_exc,
-        )
-        raise last_exc
 
-    raise RuntimeError("Failed to create PurchaseOrder for unknown reason")
+def create_purchase_orders_for_requests(prs, created_by=None) -> list:
+    """
+    Create one PurchaseOrder per request with a single bulk INSERT and
+    return them in input order. Callers are expected to run inside a
+    transaction and to prefetch `items` on `prs`. Attaching the POs to the
+    requests is left to the caller so it can be folded into its own update.
+    """
+    now = timezone.now()
+    numbers = po_numbers.next_po_numbers(len(prs), now)
+    pos = [
+        _new_purchase_order(pr, number, now, created_by=created_by)
+        for pr, number in zip(prs, numbers)
+    ]
+    created = PurchaseOrder.objects.bulk_create(pos)
+    logger.info(
+        "created %s purchase orders for prs=%s",
+        len(created),
+        [getattr(pr, "id", None) for pr in prs],
+    )
+    return created
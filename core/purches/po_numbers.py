@@ -0,0 +1,80 @@
+"""
+PO number allocation.
+
+On PostgreSQL numbers come from the purches_po_number_seq sequence. nextval
+is never rolled back, so a value is never handed out twice, and each process
+reserves a block of PO_NUMBER_BLOCK_SIZE values at a time so most
+allocations don't touch the database. Values lost with a process (or a
+rolled back transaction) leave gaps, never duplicates.
+
+Other databases fall back to a row-locked counter updated in the caller's
+transaction.
+"""
+
+import os
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.purches.models import PONumberCounter
+
+SEQUENCE = "purches_po_number_seq"
+COUNTER = "purchase_order"
+DEFAULT_FORMAT = "PO-{year}-{seq:07d}"
+
+_lock = threading.Lock()
+_block = deque()
+_block_pid = None
+
+
+def _sequence_values(n) -> list:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT nextval(%s) FROM generate_series(1, %s)", [SEQUENCE, n])
+        return sorted(row[0] for row in cursor.fetchall())
+
+
+def _counter_values(n) -> list:
+    with transaction.atomic():
+        counter, _ = PONumberCounter.objects.select_for_update().get_or_create(
+            name=COUNTER
+        )
+        PONumberCounter.objects.filter(pk=COUNTER).update(
+            next_value=F("next_value") + n
+        )
+    return list(range(counter.next_value, counter.next_value + n))
+
+
+def allocate(n=1) -> list:
+    """Return `n` unused sequence values, ascending within the call."""
+    global _block_pid
+    if connection.vendor != "postgresql":
+        return _counter_values(n)
+
+    block_size = max(int(getattr(settings, "PO_NUMBER_BLOCK_SIZE", 20)), 1)
+    with _lock:
+        if _block_pid != os.getpid():
+            # a forked worker must not reuse its parent's reserved block
+            _block.clear()
+            _block_pid = os.getpid()
+        if len(_block) < n:
+            _block.extend(_sequence_values(max(block_size, n - len(_block))))
+        return [_block.popleft() for _ in range(n)]
+
+
+def format_po_number(seq, when=None) -> str:
+    when = when or timezone.now()
+    fmt = getattr(settings, "PO_NUMBER_FORMAT", DEFAULT_FORMAT)
+    return fmt.format(seq=seq, year=when.year, month=when.month, day=when.day)
+
+
+def next_po_numbers(n, when=None) -> list:
+    when = when or timezone.now()
+    return [format_po_number(seq, when) for seq in allocate(n)]
+
+
+def next_po_number(when=None) -> str:
+    return next_po_numbers(1, when)[0]
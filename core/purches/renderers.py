@@ -0,0 +1,88 @@
+"""
+orjson-backed drop-ins for DRF's JSONRenderer and JSONParser.
+
+Rendered bytes match rest_framework.renderers.JSONRenderer: datetimes,
+Decimals, lazy strings and anything else orjson doesn't encode natively go
+through DRF's own JSONEncoder.default, and whatever orjson would write
+differently (floats below 1e-4 or from 1e16 up, ints beyond 64 bits, non-str
+keys, indented or ASCII-only output) is handed to DRF's renderer. The one
+difference left is NaN/Infinity, which orjson writes as null where strict
+DRF raises.
+
+Without orjson installed both classes behave exactly like DRF's.
+"""
+
+import io
+import re
+
+from django.conf import settings
+from rest_framework import parsers, renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# floats orjson writes differently from json: 1e16 vs 1e+16 and 0.00001 vs
+# 1e-05. Both checks start from a literal so they stay a fraction of dumps()
+_EXPONENT = re.compile(rb"e[-0-9]")
+_SMALL_FLOAT = b"0.0000"
+# orjson reads integers past 64 bits as floats; json keeps them exact
+_LONG_INTEGER = re.compile(rb"[0-9]{19}")
+
+_default = JSONEncoder().default
+
+
+def _floats_differ(ret):
+    if _SMALL_FLOAT in ret:
+        return True
+    return any(48 <= ret[m.start() - 1] <= 57 for m in _EXPONENT.finditer(ret))
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    def _fast_render(self, data, accepted_media_type, renderer_context):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return None
+        if self.get_indent(accepted_media_type, renderer_context):
+            return None
+        try:
+            ret = orjson.dumps(
+                data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except orjson.JSONEncodeError:
+            return None
+        if _floats_differ(ret):
+            return None
+        # same escaping DRF applies so the output is safe inside <script>
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        ret = self._fast_render(data, accepted_media_type, renderer_context or {})
+        if ret is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret
+
+
+class JSONParser(parsers.JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("_", "-") not in (
+            "utf-8",
+            "utf8",
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if not _LONG_INTEGER.search(body):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+        # invalid bodies too, so error messages stay DRF's
+        return super().parse(io.BytesIO(body), media_type, parser_context)
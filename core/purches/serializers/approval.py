@@ -1,10 +1,15 @@
 from rest_framework import serializers
 
-from core.purches.models import Approval
+from core.purches.models import Approval, PurchaseRequest
 
+from .eager_loading import EagerLoadingMixin
+from .purchase_request import PurchaseRequestRowSerializer
+from .values import ValuesSerializer
 
-class MyApprovalSerializer(serializers.ModelSerializer):
+
+class MyApprovalSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     purchase_request = serializers.SerializerMethodField(read_only=True)
+    select_related_fields = ("purchase_request",)
 
     class Meta:
         model = Approval
@@ -28,3 +33,94 @@ class MyApprovalSerializer(serializers.ModelSerializer):
             "required_approvers": getattr(pr, "required_approvers", None),
             "data": getattr(pr, "data", None),
         }
+
+
+class MyApprovalRowSerializer(ValuesSerializer):
+    """MyApprovalSerializer output for list pages, built from values()."""
+
+    model = Approval
+    fields = MyApprovalSerializer.Meta.fields
+    extra_columns = ("purchase_request_id", "purchase_request__status")
+
+    def get_purchase_request(self, row):
+        # PurchaseRequest has no required_approvers/data; MyApprovalSerializer
+        # has always returned them as null
+        return {
+            "id": row["purchase_request_id"],
+            "status": row["purchase_request__status"],
+            "required_approvers": None,
+            "data": None,
+        }
+
+
+class ApprovalRowSerializer(ValuesSerializer):
+    """
+    Approval history rows of one purchase request; the request's serialized
+    data is passed in as context["purchase_request"].
+    """
+
+    model = Approval
+    fields = (
+        "id",
+        "level",
+        "decision",
+        "comment",
+        "created_at",
+        "approver_id",
+        "purchase_request_id",
+        "approver_name",
+        "purchase_request",
+    )
+    extra_columns = ("approver__first_name", "approver__last_name")
+
+    def get_approver_name(self, row):
+        first = row["approver__first_name"] or ""
+        last = row["approver__last_name"] or ""
+        return f"{first} {last}".strip() or None
+
+    def get_purchase_request(self, row):
+        return self.context.get("purchase_request")
+
+
+class RejectedApprovalRowSerializer(ApprovalRowSerializer):
+    """The caller's rejections, each with its serialized purchase request."""
+
+    fields = ApprovalRowSerializer.fields + ("purchase_request_rejected",)
+    extra_columns = ApprovalRowSerializer.extra_columns + ("purchase_request__status",)
+
+    def prepare(self, rows):
+        pr_ids = {row["purchase_request_id"] for row in rows}
+        prs = (
+            PurchaseRequest.objects.filter(pk__in=pr_ids).values(
+                *PurchaseRequestRowSerializer.columns()
+            )
+            if pr_ids
+            else []
+        )
+        self.purchase_requests = {
+            data["id"]: data
+            for data in PurchaseRequestRowSerializer(self.context).to_representation(
+                prs
+            )
+        }
+
+    def get_approver_name(self, row):
+        first = row["approver__first_name"] or ""
+        last = row["approver__last_name"] or ""
+        return " ".join(n for n in (first, last) if n).strip()
+
+    def get_purchase_request(self, row):
+        return self.purchase_requests.get(row["purchase_request_id"])
+
+    def get_purchase_request_rejected(self, row):
+        return row["purchase_request__status"] == PurchaseRequest.Status.REJECTED
+
+
+class BulkDecisionSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500,
+    )
+    decision = serializers.ChoiceField(choices=("approve", "reject"))
+    comment = serializers.CharField(required=False, allow_blank=True, default="")
@@ -1,6 +1,88 @@
+import io
+import zipfile
+
+from django.conf import settings
 from rest_framework import serializers
 
+from core.purches.models import ProformaJob
+
 
 class ProformaUploadSerializer(serializers.Serializer):
     file = serializers.FileField()
     auto_create_po = serializers.BooleanField(required=False, default=False)
+    # "async" queues a background job; falls back to PROFORMA_ASYNC_EXTRACTION
+    mode = serializers.ChoiceField(choices=("sync", "async"), required=False)
+
+
+class ProformaBatchUploadSerializer(serializers.Serializer):
+    """Several proformas as repeated `files` parts and/or one zip `archive`."""
+
+    files = serializers.ListField(
+        child=serializers.FileField(), required=False, allow_empty=True
+    )
+    archive = serializers.FileField(required=False)
+    auto_create_po = serializers.BooleanField(required=False, default=False)
+
+    def _unpack_archive(self, archive, max_files, max_size):
+        try:
+            zf = zipfile.ZipFile(archive)
+        except zipfile.BadZipFile:
+            raise serializers.ValidationError({"archive": "Not a valid zip file."})
+        out = []
+        with zf:
+            for info in zf.infolist():
+                if info.is_dir() or info.filename.startswith("__MACOSX/"):
+                    continue
+                if len(out) >= max_files:
+                    raise serializers.ValidationError(
+                        {"archive": f"At most {max_files} files per batch."}
+                    )
+                if info.file_size > max_size:
+                    raise serializers.ValidationError(
+                        {"archive": f"{info.filename} exceeds {max_size} bytes."}
+                    )
+                out.append((info.filename, io.BytesIO(zf.read(info))))
+        return out
+
+    def validate(self, attrs):
+        max_files = getattr(settings, "PROFORMA_BATCH_MAX_FILES", 100)
+        max_size = getattr(settings, "PROFORMA_BATCH_MAX_FILE_SIZE", 20 * 1024 * 1024)
+
+        entries = []
+        for f in attrs.get("files") or []:
+            if f.size > max_size:
+                raise serializers.ValidationError(
+                    {"files": f"{f.name} exceeds {max_size} bytes."}
+                )
+            entries.append((f.name, f))
+        archive = attrs.get("archive")
+        if archive is not None:
+            entries.extend(
+                self._unpack_archive(archive, max_files - len(entries), max_size)
+            )
+
+        if not entries:
+            raise serializers.ValidationError("Upload `files` or a zip `archive`.")
+        if len(entries) > max_files:
+            raise serializers.ValidationError(
+                {"files": f"At most {max_files} files per batch."}
+            )
+        attrs["entries"] = entries
+        return attrs
+
+
+class ProformaJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProformaJob
+        fields = (
+            "id",
+            "status",
+            "auto_create_po",
+            "result",
+            "error",
+            "purchase_order",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+        read_only_fields = fields
@@ -0,0 +1,21 @@
+class EagerLoadingMixin:
+    """
+    Lets a serializer declare the relations it reads so views can load them
+    up front instead of once per row. `prefix` is for querysets that reach
+    the serialized model through a relation, e.g. "purchase_request__".
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, prefix=""):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(
+                *(prefix + f for f in cls.select_related_fields)
+            )
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(
+                *(prefix + f for f in cls.prefetch_related_fields)
+            )
+        return queryset
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from core.purches.models import PurchaseRequest
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    """Query parameters of the export endpoints; both dates are inclusive."""
+
+    # not "format": DRF reserves that for renderer negotiation
+    output = serializers.ChoiceField(choices=("csv", "ndjson"), default="csv")
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    status = serializers.ChoiceField(
+        choices=PurchaseRequest.Status.choices, required=False
+    )
+
+    def validate(self, attrs):
+        start, end = attrs.get("date_from"), attrs.get("date_to")
+        if start and end and start > end:
+            raise serializers.ValidationError(
+                {"date_to": "Must not be before date_from."}
+            )
+        return attrs
@@ -3,11 +3,108 @@ from rest_framework import serializers
 
 from core.purches.models import Approval, PurchaseOrder
 
-from .purchase_order_utils import approver_from_embedded, extract_pr_id_from_data
+from .purchase_order_utils import (
+    approver_from_embedded,
+    embedded_approver_id,
+    extract_pr_id_from_data,
+)
+from .values import ValuesSerializer
 
 User = get_user_model()
 
 
+def _pr_id(obj):
+    pr_id = getattr(obj, "purchase_request_id", None)
+    if pr_id is None:
+        try:
+            pr_id = extract_pr_id_from_data(obj.data or {})
+        except Exception:
+            pr_id = None
+    return pr_id
+
+
+def _approver_dict(approver):
+    first = getattr(approver, "first_name", "")
+    last = getattr(approver, "last_name", "")
+    return {
+        "id": getattr(approver, "id", None),
+        "first_name": first,
+        "last_name": last,
+        "full_name": " ".join(n for n in (first, last) if n).strip(),
+    }
+
+
+def snapshot_approver(po):
+    """Approver dict from the PO's own columns, or None if not snapshotted."""
+    if not po.approved_by_id:
+        return None
+    return {
+        "id": po.approved_by_id,
+        "first_name": po.approver_first_name,
+        "last_name": po.approver_last_name,
+        "full_name": po.approver_full_name,
+    }
+
+
+def resolve_approvers(pos):
+    """
+    Approver dicts for POs without a snapshot, keyed by PO pk, derived from
+    Approval rows (one query) and embedded PO data (one more). Used for list
+    pages with legacy rows and by the backfill_po_approvers command.
+    """
+    pr_ids = {pid for pid in map(_pr_id, pos) if pid}
+    by_pr = {}
+    if pr_ids:
+        approvals = (
+            Approval.objects.filter(
+                purchase_request_id__in=pr_ids,
+                decision=Approval.Decision.APPROVED,
+            )
+            .select_related("approver")
+            .order_by("purchase_request_id", "-created_at")
+        )
+        # latest level-2 approval wins, else the latest approval of any level
+        for a in approvals:
+            best = by_pr.get(a.purchase_request_id)
+            if best is None or (a.level == 2 and best.level != 2):
+                by_pr[a.purchase_request_id] = a
+
+    resolved, embedded = {}, {}
+    for po in pos:
+        approval = by_pr.get(_pr_id(po))
+        if approval is not None and approval.approver is not None:
+            resolved[po.pk] = approval.approver
+            continue
+        try:
+            approver_id = int(embedded_approver_id(po.data or {}) or 0)
+        except (TypeError, ValueError, AttributeError):
+            approver_id = 0
+        if approver_id:
+            embedded[po.pk] = approver_id
+
+    users = User.objects.in_bulk(set(embedded.values())) if embedded else {}
+    for po_pk, approver_id in embedded.items():
+        if approver_id in users:
+            resolved[po_pk] = users[approver_id]
+    return resolved
+
+
+class PurchaseOrderListSerializer(serializers.ListSerializer):
+    """
+    Serves approvers from each PO's snapshot; rows created before snapshots
+    existed are resolved for the whole page at once (see resolve_approvers).
+    """
+
+    def to_representation(self, data):
+        pos = list(data.all() if hasattr(data, "all") else data)
+        legacy = [po for po in pos if not po.approved_by_id]
+        self.approvers = {
+            pk: _approver_dict(user)
+            for pk, user in (resolve_approvers(legacy) if legacy else {}).items()
+        }
+        return super().to_representation(pos)
+
+
 class PurchaseOrderSerializer(serializers.ModelSerializer):
     approver = serializers.SerializerMethodField(read_only=True)
     # purchase_request removed to avoid embedding the full PR in PO responses
@@ -16,13 +113,17 @@ class PurchaseOrderSerializer(serializers.ModelSerializer):
         model = PurchaseOrder
         fields = ("id", "po_number", "data", "generated_at", "approver")
         read_only_fields = ("id", "generated_at", "po_number", "approver")
+        list_serializer_class = PurchaseOrderListSerializer
 
     def get_approver(self, obj):
-        pr_id = None
-        try:
-            pr_id = extract_pr_id_from_data(obj.data or {})
-        except Exception:
-            pr_id = None
+        snapshot = snapshot_approver(obj)
+        if snapshot is not None:
+            return snapshot
+        approvers = getattr(self.parent, "approvers", None)
+        if approvers is not None:
+            return approvers.get(obj.pk)
+
+        pr_id = _pr_id(obj)
 
         if pr_id:
             approval = (
@@ -44,30 +145,41 @@ class PurchaseOrderSerializer(serializers.ModelSerializer):
                     .first()
                 )
             if approval and getattr(approval, "approver", None):
-                approver = approval.approver
-                first = getattr(approver, "first_name", "")
-                last = getattr(approver, "last_name", "")
-                full_name = " ".join(n for n in (first, last) if n).strip()
-                return {
-                    "id": getattr(approver, "id", None),
-                    "first_name": first,
-                    "last_name": last,
-                    "full_name": full_name,
-                }
+                return _approver_dict(approval.approver)
 
         try:
             approver_user = approver_from_embedded(obj.data or {})
             if approver_user:
-                first = getattr(approver_user, "first_name", "")
-                last = getattr(approver_user, "last_name", "")
-                full_name = " ".join(n for n in (first, last) if n).strip()
-                return {
-                    "id": getattr(approver_user, "id", None),
-                    "first_name": first,
-                    "last_name": last,
-                    "full_name": full_name,
-                }
+                return _approver_dict(approver_user)
         except Exception:
             pass
 
         return None
+
+
+class PurchaseOrderRowSerializer(ValuesSerializer):
+    """PurchaseOrderSerializer output for list pages, built from values()."""
+
+    model = PurchaseOrder
+    fields = PurchaseOrderSerializer.Meta.fields
+    extra_columns = ("approved_by_id", "approver_first_name", "approver_last_name")
+
+    def prepare(self, rows):
+        legacy = [row["id"] for row in rows if not row["approved_by_id"]]
+        resolved = (
+            resolve_approvers(list(PurchaseOrder.objects.filter(pk__in=legacy)))
+            if legacy
+            else {}
+        )
+        self.approvers = {pk: _approver_dict(user) for pk, user in resolved.items()}
+
+    def get_approver(self, row):
+        if not row["approved_by_id"]:
+            return self.approvers.get(row["id"])
+        first, last = row["approver_first_name"], row["approver_last_name"]
+        return {
+            "id": row["approved_by_id"],
+            "first_name": first,
+            "last_name": last,
+            "full_name": f"{first} {last}".strip(),
+        }
@@ -19,7 +19,8 @@ def extract_pr_id_from_data(data):
     return None
 
 
-def approver_from_embedded(data):
+def embedded_approver_id(data):
+    """Id of the approver recorded in PO data, without loading the user."""
     approvals = data.get("approvals")
     if not isinstance(approvals, (list, tuple)):
         nested = data.get("data") if isinstance(data.get("data"), dict) else None
@@ -48,7 +49,11 @@ def approver_from_embedded(data):
         approved.sort(key=lambda x: x.get("created_at") or "", reverse=True)
         cand = approved[0]
 
-    approver_id = cand.get("approver_id") or cand.get("approver")
+    return cand.get("approver_id") or cand.get("approver") or None
+
+
+def approver_from_embedded(data):
+    approver_id = embedded_approver_id(data)
     if not approver_id:
         return None
     return User.objects.filter(id=approver_id).first()
@@ -1,17 +1,21 @@
 import logging
 from decimal import Decimal
 
+from django.db import transaction
 from rest_framework import serializers
 
 from core.purches.models import PurchaseRequest, RequestItem
 
-from .request_item import RequestItemSerializer
+from .eager_loading import EagerLoadingMixin
+from .request_item import RequestItemRowSerializer, RequestItemSerializer
+from .values import ValuesSerializer
 
 logger = logging.getLogger(__name__)
 
 
-class PurchaseRequestSerializer(serializers.ModelSerializer):
+class PurchaseRequestSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     items = RequestItemSerializer(many=True, required=False)
+    prefetch_related_fields = ("items",)
 
     class Meta:
         model = PurchaseRequest
@@ -32,37 +36,64 @@ class PurchaseRequestSerializer(serializers.ModelSerializer):
             "created_at",
         )
 
-    def _recalc_total(self, pr):
-        total = 0
-        for it in pr.items.all():
-            qty = getattr(it, "quantity", 1) or 1
-            unit = getattr(it, "unit_price", 0) or 0
-            total += qty * unit
-        pr.total_amount = total
-        pr.save(update_fields=["total_amount"])
+    @staticmethod
+    def _item_key(it):
+        return (it["name"], it.get("quantity", 1), it["unit_price"])
+
+    @staticmethod
+    def _items_total(items):
+        total = Decimal("0.00")
+        for it in items:
+            total += (it.get("quantity", 1) or 1) * (it.get("unit_price") or 0)
+        return total
 
     def create(self, validated_data):
         items = validated_data.pop("items", [])
-        # ensure DB non-null constraint is satisfied
-        # total will be recalculated after items are created
-        validated_data.setdefault("total_amount", Decimal("0.00"))
-        pr = super().create(validated_data)
-        for it in items:
-            RequestItem.objects.create(purchase_request=pr, **it)
-        self._recalc_total(pr)
+        # total comes straight from the validated lines, so the PR row is
+        # written once and the items in a single INSERT
+        validated_data["total_amount"] = self._items_total(items)
+        with transaction.atomic():
+            pr = super().create(validated_data)
+            RequestItem.objects.bulk_create(
+                [RequestItem(purchase_request=pr, **it) for it in items]
+            )
         return pr
 
     def update(self, instance, validated_data):
         items = validated_data.pop("items", None)
-        pr = super().update(instance, validated_data)
-        if items is not None:
-            # simple strategy: remove existing and recreate (or implement diff)
-            pr.items.all().delete()
-            for it in items:
-                RequestItem.objects.create(purchase_request=pr, **it)
-            self._recalc_total(pr)
+        with transaction.atomic():
+            if items is not None:
+                self._sync_items(instance, items)
+                validated_data["total_amount"] = self._items_total(items)
+            pr = super().update(instance, validated_data)
         return pr
 
+    def _sync_items(self, pr, items):
+        """
+        Diff the submitted lines against the stored ones by content: matching
+        lines are left untouched, only removed lines are deleted and only new
+        lines are inserted.
+        """
+        existing = {}
+        for row in pr.items.values("id", "name", "quantity", "unit_price"):
+            existing.setdefault(self._item_key(row), []).append(row["id"])
+
+        to_create = []
+        for it in items:
+            ids = existing.get(self._item_key(it))
+            if ids:
+                ids.pop()
+            else:
+                to_create.append(RequestItem(purchase_request=pr, **it))
+
+        stale = [pk for ids in existing.values() for pk in ids]
+        if stale:
+            RequestItem.objects.filter(pk__in=stale).delete()
+        if to_create:
+            RequestItem.objects.bulk_create(to_create)
+        # drop any prefetched items so the response reflects the new lines
+        getattr(pr, "_prefetched_objects_cache", {}).pop("items", None)
+
     def some_method_that_might_fail(self):
         try:
             # placeholder for logic; keep 'pass' so the try block is syntactically valid
@@ -71,5 +102,28 @@ class PurchaseRequestSerializer(serializers.ModelSerializer):
             logger.exception("purchase_request handling failed: %s", exc)
 
 
+class PurchaseRequestRowSerializer(ValuesSerializer):
+    """PurchaseRequestSerializer output for list pages, built from values()."""
+
+    model = PurchaseRequest
+    fields = PurchaseRequestSerializer.Meta.fields
+
+    def prepare(self, rows):
+        self.items = {}
+        if not rows:
+            return
+        item_serializer = RequestItemRowSerializer()
+        items = list(
+            RequestItem.objects.filter(purchase_request_id__in=[r["id"] for r in rows])
+            .order_by("pk")
+            .values("purchase_request_id", *item_serializer.columns())
+        )
+        for row, data in zip(items, item_serializer.to_representation(items)):
+            self.items.setdefault(row["purchase_request_id"], []).append(data)
+
+    def get_items(self, row):
+        return self.items.get(row["id"], [])
+
+
 # backward-compatible alias used by views
 PurchaseRequestDetailSerializer = PurchaseRequestSerializer
@@ -2,6 +2,8 @@ from rest_framework import serializers
 
 from core.purches.models import Receipt
 
+from .values import ValuesSerializer
+
 
 class ReceiptUploadSerializer(serializers.Serializer):
     file_url = serializers.URLField(
@@ -23,3 +25,8 @@ class ReceiptSerializer(serializers.ModelSerializer):
             "uploaded_by",
             "purchase_request",
         )
+
+
+class ReceiptRowSerializer(ValuesSerializer):
+    model = Receipt
+    fields = ReceiptSerializer.Meta.fields
@@ -2,9 +2,16 @@ from rest_framework import serializers
 
 from core.purches.models import RequestItem
 
+from .values import ValuesSerializer
+
 
 class RequestItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = RequestItem
         fields = ("id", "name", "quantity", "unit_price")
         read_only_fields = ("id",)
+
+
+class RequestItemRowSerializer(ValuesSerializer):
+    model = RequestItem
+    fields = RequestItemSerializer.Meta.fields
@@ -0,0 +1,110 @@
+"""
+Read-only row serializers for list endpoints.
+
+A ValuesSerializer turns `queryset.values()` dicts into response dicts with
+one converter per field, compiled once per class from the model fields, and
+skips DRF's per-row field machinery. The output matches the ModelSerializer
+it stands in for: decimals are quantized strings, datetimes ISO 8601 in the
+current timezone with "Z" for UTC, relations are primary keys.
+
+Keys listed in `fields` that have a `get_<key>(row)` method are computed by
+it; `extra_columns` are fetched for those methods but not emitted, and
+`prepare(rows)` runs once per page to batch-load anything they need.
+"""
+
+import decimal
+
+from django.db import models
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
+
+def _decimal_converter(field):
+    quantum = decimal.Decimal(".1") ** field.decimal_places
+    context = decimal.getcontext().copy()
+    context.prec = field.max_digits
+    if not api_settings.COERCE_DECIMAL_TO_STRING:
+        return lambda value: value.quantize(quantum, context=context)
+    return lambda value: "{:f}".format(value.quantize(quantum, context=context))
+
+
+def _datetime(value):
+    value = value.astimezone(timezone.get_current_timezone()).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _date(value):
+    return value.isoformat()
+
+
+def converter_for(field):
+    """Value converter for a model field, or None when values pass as-is."""
+    if isinstance(field, models.DecimalField):
+        return _decimal_converter(field)
+    if isinstance(field, models.DateTimeField):
+        return _datetime
+    if isinstance(field, models.DateField):
+        return _date
+    return None
+
+
+class ValuesSerializer:
+    model = None
+    fields = ()
+    extra_columns = ()
+
+    def __init__(self, context=None):
+        self.context = context or {}
+
+    @classmethod
+    def _compile(cls):
+        compiled = cls.__dict__.get("_compiled")
+        if compiled is not None:
+            return compiled
+        compiled = []
+        for key in cls.fields:
+            method = getattr(cls, f"get_{key}", None)
+            if method is not None:
+                compiled.append((key, None, None, f"get_{key}"))
+                continue
+            field = cls.model._meta.get_field(key)
+            # relations serialize as their primary key, read from the FK column
+            column = field.attname if field.is_relation else key
+            compiled.append((key, column, converter_for(field), None))
+        cls._compiled = compiled
+        return compiled
+
+    @classmethod
+    def columns(cls) -> tuple:
+        """Column names to pass to queryset.values()."""
+        cols = [column for _, column, _, _ in cls._compile() if column]
+        return tuple(dict.fromkeys(cols + list(cls.extra_columns)))
+
+    def prepare(self, rows):
+        """Hook to batch-load data for the method fields of a page."""
+
+    def to_representation(self, rows) -> list:
+        rows = list(rows)
+        self.prepare(rows)
+        compiled = [
+            (key, column, convert, getattr(self, method) if method else None)
+            for key, column, convert, method in self._compile()
+        ]
+        out = []
+        for row in rows:
+            item = {}
+            for key, column, convert, method in compiled:
+                if method is not None:
+                    item[key] = method(row)
+                    continue
+                value = row[column]
+                item[key] = (
+                    value if convert is None or value is None else convert(value)
+                )
+            out.append(item)
+        return out
+
+    def serialize(self, queryset) -> list:
+        return self.to_representation(queryset.values(*self.columns()))
@@ -1,25 +1,60 @@
+import hashlib
+import json
 import logging
-import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
 
 import pdfplumber
-import pytesseract
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
-from django.db import IntegrityError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, close_old_connections, connection
 from django.db import models as django_models
 from django.db import transaction
-from PIL import Image
+from django.utils import timezone
+from pdfminer.pdfpage import PDFPage
+from pdfplumber.page import Page as PdfPlumberPage
 from rest_framework import status
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 
-from core.purches.models import Approval, PurchaseOrder, PurchaseRequest
+from core.purches.models import (
+    Approval,
+    ProformaJob,
+    PurchaseOrder,
+    PurchaseOrderItem,
+    PurchaseRequest,
+)
 
-from .po import create_purchase_order_for_request
+from . import extraction_cache, extractors, ocr, outbox, po_numbers, triage
 
 logger = logging.getLogger(__name__)
 
+# bump whenever extraction code changes output so cached results are not
+# reused; settings that change output are hashed in by extractor_version()
+PROFORMA_EXTRACTOR_VERSION = "5"
+
+
+def extractor_version() -> str:
+    """
+    Cache version for extractions: PROFORMA_EXTRACTOR_VERSION plus a short
+    hash of the vendor templates, OCR preprocessing and triage settings.
+    """
+    config = {
+        "templates": getattr(settings, "PROFORMA_VENDOR_TEMPLATES", None) or [],
+        "ocr": ocr.preprocess_options(),
+        "triage": [
+            getattr(settings, "PROFORMA_TRIAGE_SAMPLE_PAGES", 3),
+            getattr(settings, "PROFORMA_TRIAGE_MIN_CHARS", 50),
+            getattr(settings, "PROFORMA_TRIAGE_IMAGE_COVERAGE", 0.5),
+        ],
+    }
+    raw = json.dumps(config, sort_keys=True, default=repr).encode()
+    return f"{PROFORMA_EXTRACTOR_VERSION}-{hashlib.sha256(raw).hexdigest()[:12]}"
+
 
 def get_purchase_request_for_action(view, lookup_value):
     lookup_field = getattr(view, "lookup_field", "pk")
@@ -32,127 +67,83 @@ def get_purchase_request_for_action(view, lookup_value):
 def approve_purchase_request(
     user, pr: PurchaseRequest, level: int, comment: str = None
 ):
-    po = None
-    current_level = getattr(pr, "current_approval_level", 1)
-    msg = (
-        "approve_purchase_request called: pr=%s user=%s role=%s "
-        "level=%s current_level=%s"
-    )
+    """
+    Record `user`'s approval at `level` and advance the request.
+
+    Runs as one transaction holding a row lock on the PR, so concurrent
+    approvers are serialized and only one of them can act on a given level.
+    Non-final approvals cost three statements (lock, insert, update); the
+    PR passed in is updated in place with the new state.
+    """
     logger.info(
-        msg,
+        "approve_purchase_request called: pr=%s user=%s role=%s level=%s",
         getattr(pr, "id", None),
         getattr(user, "id", None),
         getattr(user, "role", None),
         level,
-        current_level,
     )
 
     PENDING = getattr(PurchaseRequest.Status, "PENDING", "PENDING")
     APPROVED = getattr(PurchaseRequest.Status, "APPROVED", "APPROVED")
-
-    if getattr(pr, "status", None) != PENDING:
-        return (
-            {"detail": "only_pending_requests_can_be_approved"},
-            status.HTTP_400_BAD_REQUEST,
-        )
-
-    required_levels = int(getattr(pr, "required_approval_levels", 2) or 2)
-    if current_level is None:
-        return ({"detail": "approval_already_finalized"}, status.HTTP_400_BAD_REQUEST)
-
-    if int(level) != int(current_level):
-        return (
-            {
-                "detail": "not_your_turn",
-                "expected_level": current_level,
-                "your_level": level,
-            },
-            status.HTTP_403_FORBIDDEN,
-        )
-
-    if Approval.objects.filter(
-        purchase_request=pr,
-        level=level,
-        approver=user,
-        decision=Approval.Decision.APPROVED,
-    ).exists():
-        return ({"detail": "already_approved_by_you"}, status.HTTP_400_BAD_REQUEST)
+    level = int(level)
 
     try:
         with transaction.atomic():
-            Approval.objects.create(
-                purchase_request=pr,
-                approver=user,
-                level=level,
-                decision=Approval.Decision.APPROVED,
-                comment=comment or "",
-            )
-
-            is_final = int(level) == int(required_levels)
-            logger.debug(
-                "PR=%s required=%s current=%s acting=%s is_final=%s",
-                getattr(pr, "id", None),
-                required_levels,
-                current_level,
-                level,
-                is_final,
-            )
-            if is_final:
-                pr.status = APPROVED
-                pr.current_approval_level = None
+            locked = PurchaseRequest.objects.select_for_update().get(pk=pr.pk)
+            current_level = locked.current_approval_level
 
-                if not getattr(pr, "purchase_order_id", None):
-                    try:
-                        try:
-                            po = create_purchase_order_for_request(pr, created_by=user)
-                        except TypeError:
-                            po = create_purchase_order_for_request(pr)
-                        if po:
-                            try:
-                                pr.purchase_order = po
-                            except Exception:
-                                pass
-                    except Exception as po_exc:
-                        logger.exception(
-                            "create_purchase_order_for_request failed for pr=%s: %s",
-                            getattr(pr, "id", None),
-                            po_exc,
-                        )
-            else:
-                pr.current_approval_level = int(level) + 1
-
-            update_fields = ["status", "current_approval_level"]
-            if po is not None or getattr(pr, "purchase_order_id", None):
-                update_fields.append("purchase_order")
-            pr.save(update_fields=update_fields)
-
-            approved_levels = (
-                Approval.objects.filter(
-                    purchase_request=pr, decision=Approval.Decision.APPROVED
+            if locked.status != PENDING:
+                return (
+                    {"detail": "only_pending_requests_can_be_approved"},
+                    status.HTTP_400_BAD_REQUEST,
+                )
+            if current_level is None:
+                return (
+                    {"detail": "approval_already_finalized"},
+                    status.HTTP_400_BAD_REQUEST,
+                )
+            if level != int(current_level):
+                return (
+                    {
+                        "detail": "not_your_turn",
+                        "expected_level": current_level,
+                        "your_level": level,
+                    },
+                    status.HTTP_403_FORBIDDEN,
                 )
-                .values_list("level", flat=True)
-                .distinct()
-            )
-            approved_levels_set = {
-                int(lvl) for lvl in approved_levels if lvl is not None
-            }
 
-            payload = {
-                "detail": "approved",
-                "purchase_request_id": pr.id,
-                "approved_level": level,
-                "approved_levels": sorted(list(approved_levels_set)),
-                "current_approval_level": pr.current_approval_level,
-                "status": pr.status,
-                "purchase_request": _serialize_pr_min(pr),
-                **(
-                    {"purchase_order_id": getattr(po, "id", None)}
-                    if po is not None
-                    else {}
-                ),
-            }
-            return (payload, status.HTTP_200_OK)
+            # levels are approved strictly in order, so while we hold the lock
+            # nobody else has approved this level; the unique constraint on
+            # (request, approver, level) still guards against stale rows
+            try:
+                with transaction.atomic():
+                    Approval.objects.create(
+                        purchase_request=locked,
+                        approver=user,
+                        level=level,
+                        decision=Approval.Decision.APPROVED,
+                        comment=comment or "",
+                    )
+            except IntegrityError:
+                return (
+                    {"detail": "already_approved_by_you"},
+                    status.HTTP_400_BAD_REQUEST,
+                )
 
+            required_levels = int(locked.required_approval_levels or 2)
+            is_final = level >= required_levels
+            if is_final:
+                locked.status = APPROVED
+                locked.current_approval_level = None
+                if not locked.purchase_order_id:
+                    # PO generation runs after commit, off this request
+                    outbox.request_purchase_order(locked, approver=user)
+            else:
+                locked.current_approval_level = level + 1
+            # updated_at drives the ETags of PR responses
+            locked.save(
+                update_fields=["status", "current_approval_level", "updated_at"]
+            )
     except Exception as exc:
         logger.exception(
             "approve_purchase_request unexpected error for pr=%s user=%s level=%s",
@@ -165,13 +156,30 @@ def approve_purchase_request(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
+    if is_final and not locked.purchase_order_id:
+        # set already if the outbox was drained eagerly on commit
+        locked.purchase_order_id = (
+            PurchaseRequest.objects.filter(pk=locked.pk)
+            .values_list("purchase_order_id", flat=True)
+            .first()
+        )
+
+    # keep the caller's instance in step with what was committed
+    pr.status = locked.status
+    pr.current_approval_level = locked.current_approval_level
+    pr.purchase_order_id = locked.purchase_order_id
+
     payload = {
-        "detail": "approval_recorded",
-        "purchase_request_id": pr.id,
+        "detail": "approved",
+        "purchase_request_id": locked.id,
         "approved_level": level,
-        "approved_levels": sorted(list(approved_levels_set)),
-        "status": pr.status,
+        "approved_levels": list(range(1, level + 1)),
+        "current_approval_level": locked.current_approval_level,
+        "status": locked.status,
+        "purchase_request": _serialize_pr_min(locked),
     }
+    if locked.purchase_order_id:
+        payload["purchase_order_id"] = locked.purchase_order_id
     return (payload, status.HTTP_200_OK)
 
 
@@ -202,10 +210,128 @@ def reject_purchase_request(user, pr):
         approval.save(update_fields=["decision", "level"])
 
     pr.status = PurchaseRequest.Status.REJECTED
-    pr.save(update_fields=["status"])
+    pr.save(update_fields=["status", "updated_at"])
     return {"detail": "Rejected"}, 200
 
 
+def decide_purchase_requests(user, ids, level, decision, comment=None):
+    """
+    Approve or reject many requests at once for an approver at `level`.
+
+    All affected PRs are locked with a single SELECT ... FOR UPDATE, checks
+    run in memory, Approval rows go in with one bulk INSERT and the PRs are
+    written back with one bulk UPDATE. POs for requests reaching their final
+    level are generated together. Returns a list of per-id results in the
+    order the ids were given.
+    """
+    PENDING = getattr(PurchaseRequest.Status, "PENDING", "PENDING")
+    APPROVED = getattr(PurchaseRequest.Status, "APPROVED", "APPROVED")
+    REJECTED = getattr(PurchaseRequest.Status, "REJECTED", "REJECTED")
+    approve = decision == Approval.Decision.APPROVED
+    level = int(level)
+    ids = list(dict.fromkeys(int(i) for i in ids))
+
+    results = {}
+    with transaction.atomic():
+        # lock in pk order so overlapping batches can't deadlock
+        locked = {
+            pr.pk: pr
+            for pr in PurchaseRequest.objects.select_for_update()
+            .filter(pk__in=ids)
+            .order_by("pk")
+        }
+        decided = set(
+            Approval.objects.filter(
+                purchase_request_id__in=list(locked), approver=user
+            ).values_list("purchase_request_id", "level")
+        )
+
+        approvals, changed, finals = [], [], []
+        now = timezone.now()
+        for pk in ids:
+            pr = locked.get(pk)
+            if pr is None:
+                results[pk] = {"id": pk, "ok": False, "detail": "not_found"}
+                continue
+            current = pr.current_approval_level
+            if pr.status != PENDING or current is None:
+                results[pk] = {"id": pk, "ok": False, "detail": "not_pending"}
+                continue
+            if approve and current != level:
+                results[pk] = {
+                    "id": pk,
+                    "ok": False,
+                    "detail": "not_your_turn",
+                    "expected_level": current,
+                }
+                continue
+            if (pk, current) in decided:
+                results[pk] = {"id": pk, "ok": False, "detail": "already_decided"}
+                continue
+
+            approvals.append(
+                Approval(
+                    purchase_request=pr,
+                    approver=user,
+                    level=current,
+                    decision=decision,
+                    comment=comment or "",
+                )
+            )
+            if not approve:
+                pr.status = REJECTED
+            elif current >= int(pr.required_approval_levels or 2):
+                pr.status = APPROVED
+                pr.current_approval_level = None
+                if not pr.purchase_order_id:
+                    finals.append(pr)
+            else:
+                pr.current_approval_level = current + 1
+            # bulk_update skips auto_now
+            pr.updated_at = now
+            changed.append(pr)
+            results[pk] = {"id": pk, "ok": True}
+
+        Approval.objects.bulk_create(approvals)
+        if changed:
+            PurchaseRequest.objects.bulk_update(
+                changed, ["status", "current_approval_level", "updated_at"]
+            )
+        # POs are generated together by the outbox drain after commit
+        outbox.record_many(
+            (
+                outbox.CREATE_PURCHASE_ORDER,
+                outbox.purchase_order_key(pr.pk),
+                {"purchase_request_id": pr.pk, "approver_id": user.pk},
+            )
+            for pr in finals
+        )
+
+    if finals:
+        po_ids = dict(
+            PurchaseRequest.objects.filter(pk__in=[pr.pk for pr in finals]).values_list(
+                "pk", "purchase_order_id"
+            )
+        )
+        for pr in finals:
+            pr.purchase_order_id = po_ids.get(pr.pk)
+    for pr in changed:
+        results[pr.pk].update(
+            status=pr.status,
+            current_approval_level=pr.current_approval_level,
+            purchase_order_id=pr.purchase_order_id,
+        )
+    logger.info(
+        "bulk %s by user=%s level=%s: %s/%s applied",
+        decision,
+        getattr(user, "id", None),
+        level,
+        len(changed),
+        len(ids),
+    )
+    return [results[pk] for pk in ids]
+
+
 def submit_receipt_for_request(
     user, pr, uploaded_file, vendor=None, note=None, ReceiptModel=None
 ):
@@ -273,90 +399,292 @@ def submit_receipt_for_request(
     return receipt
 
 
-def _extract_text_from_pdf_fileobj(file_obj):
-    try:
-        file_obj.seek(0)
-        with pdfplumber.open(file_obj) as pdf:
-            text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-            tables = []
-            for page in pdf.pages:
+def _iter_pdf_pages(file_obj):
+    """
+    Yield pdfplumber pages one at a time. Pages are built lazily and their
+    caches are released as soon as the caller moves on, so memory does not
+    grow with the page count.
+    """
+    file_obj.seek(0)
+    with pdfplumber.open(file_obj) as pdf:
+        doctop = 0
+        for page_number, page_obj in enumerate(PDFPage.create_pages(pdf.doc), start=1):
+            page = PdfPlumberPage(
+                pdf, page_obj, page_number=page_number, initial_doctop=doctop
+            )
+            doctop += page.height
+            try:
+                yield page
+            finally:
+                page.close()
+
+
+def _process_pdf_pages(file_obj, classify_pages=False):
+    """
+    Single pass over the PDF: each page's text and table are read once.
+    Table extraction stops once line items are found and the walk stops
+    altogether once the header fields are found too. With `classify_pages`
+    each page is routed on its own and pages without a usable text layer
+    are OCR'd afterwards, only if header fields are still missing.
+    The vendor template is picked from the first page that has text.
+    """
+    extracted = {}
+    items = []
+    ocr_pages = []
+    page_routes = Counter()
+    template = None
+    for page in _iter_pdf_pages(file_obj):
+        route = triage.classify_plumber_page(page) if classify_pages else triage.TEXT
+        page_routes[route] += 1
+        if route != triage.TEXT:
+            ocr_pages.append(page.page_number - 1)
+        if route != triage.OCR:
+            text = page.extract_text() or ""
+            if template is None and text.strip():
+                template = extractors.select_template(text)
+            active = template or extractors.DEFAULT_TEMPLATE
+            active.match_header_fields(text, extracted)
+            if not items:
                 t = page.extract_table()
                 if t:
-                    tables.append(t)
-        return {"text": text, "tables": tables}
-    except Exception:
-        file_obj.seek(0)
-        img = Image.open(file_obj)
-        return {"text": pytesseract.image_to_string(img), "tables": []}
+                    items = active.parse_table(t)
+        if items and "invoice_no" in extracted and "total_amount" in extracted:
+            break
+
+    if classify_pages:
+        triage.record_pages(page_routes)
+    header_missing = "invoice_no" not in extracted or "total_amount" not in extracted
+    if ocr_pages and header_missing:
+        text = ocr.ocr_document(file_obj, pages=ocr_pages)
+        template = template or extractors.select_template(text)
+        template.match_header_fields(text, extracted)
+    extracted["items"] = items
+    return extracted
+
+
+def _process_ocr(file_obj):
+    extracted = {}
+    text = ocr.ocr_document(file_obj)
+    extractors.select_template(text).match_header_fields(text, extracted)
+    return extracted
 
 
 def process_proforma_file(file_obj):
     """
     Return a dict with keys:
       vendor, invoice_no, date, total_amount (Decimal), items (list of dicts)
+
+    PDFs are triaged first so OCR only runs for pages without a text layer.
     """
-    data = _extract_text_from_pdf_fileobj(file_obj)
-    text = data.get("text", "")
-    tables = data.get("tables", [])
+    if not ocr.is_pdf(file_obj):
+        triage.record_route("image")
+        extracted = _process_ocr(file_obj)
+    else:
+        try:
+            route = triage.triage_pdf(file_obj)
+        except Exception as exc:
+            logger.warning("PDF triage failed, reading text layer: %s", exc)
+            route = triage.TEXT
+        try:
+            if route == triage.OCR:
+                extracted = _process_ocr(file_obj)
+            else:
+                extracted = _process_pdf_pages(
+                    file_obj, classify_pages=(route == triage.HYBRID)
+                )
+        except Exception:
+            extracted = _process_ocr(file_obj)
 
-    extracted = {}
+    extracted.setdefault("items", [])
+    extracted.setdefault("vendor", None)
+    return extracted
 
-    m = re.search(r"Invoice\s*No[:\s]*([A-Za-z0-9\-\/]+)", text, re.I)
-    if m:
-        extracted["invoice_no"] = m.group(1).strip()
-    m = re.search(r"Total\s*[:\s]*\$?([\d,\.]+)", text, re.I)
-    if m:
-        extracted["total_amount"] = Decimal(m.group(1).replace(",", ""))
 
-    items = []
-    for t in tables:
-        headers = [c.strip().lower() if c else "" for c in t[0]]
-        for row in t[1:]:
-            name = None
-            qty = 1
-            unit = None
-            for idx, h in enumerate(headers):
-                cell = row[idx] if idx < len(row) else ""
-                if "description" in h or "item" in h or "name" in h:
-                    name = cell
-                if "qty" in h or "quantity" in h:
-                    try:
-                        qty = int(cell)
-                    except (ValueError, TypeError):
-                        qty = 1
-                if "price" in h or "unit" in h:
-                    try:
-                        unit = Decimal(cell.replace(",", "").replace("$", ""))
-                    except (ValueError, TypeError):
-                        unit = None
-            if name:
-                items.append({"name": name, "quantity": qty, "unit_price": unit})
-        if items:
-            break
+def extract_proforma(file_obj):
+    """
+    process_proforma_file with a content-addressed cache in front of it:
+    identical bytes (for the same extractor version and extraction settings)
+    are parsed only once.
+    """
+    if not extraction_cache.cache_enabled():
+        return process_proforma_file(file_obj)
 
-    extracted.setdefault("items", items)
-    extracted.setdefault("vendor", None)
+    digest = extraction_cache.file_digest(file_obj)
+    version = extractor_version()
+    cached = extraction_cache.get_cached_extraction(digest, version)
+    if cached is not None:
+        logger.debug("proforma cache hit digest=%s", digest)
+        return cached
+
+    extracted = process_proforma_file(file_obj)
+    try:
+        extraction_cache.store_extraction(digest, version, extracted)
+    except Exception as exc:
+        logger.exception("failed to cache proforma extraction %s: %s", digest, exc)
     return extracted
 
 
-def create_purchase_order_from_proforma(extracted, created_by):
-    po = PurchaseOrder.objects.create(
-        vendor=extracted.get("vendor") or "Unknown",
-        total_amount=extracted.get("total_amount") or 0,
-        created_by=created_by,
-        raw_data=extracted,
-    )
-    for it in extracted.get("items", []):
-        po.items.create(
-            name=it.get("name"),
+def _proforma_po_data(extracted, created_by, source_file=None) -> dict:
+    """JSON-safe PurchaseOrder.data for a PO built from a proforma."""
+    data = json.loads(json.dumps(extracted, cls=DjangoJSONEncoder))
+    data["source"] = "proforma"
+    data["created_by_id"] = getattr(created_by, "id", None)
+    if source_file:
+        data["source_file"] = source_file
+    return data
+
+
+def _proforma_po_items(extracted, label=None):
+    """
+    Validate the extracted line items and return unsaved PurchaseOrderItem
+    rows (without their purchase_order). Raises ValidationError on bad lines
+    so nothing is written for a proforma that would only half insert.
+    """
+    rows = []
+    for i, it in enumerate(extracted.get("items") or []):
+        row = PurchaseOrderItem(
+            name=(it.get("name") or "").strip(),
             quantity=it.get("quantity") or 1,
             unit_price=it.get("unit_price") or 0,
         )
-    return po
+        try:
+            row.full_clean(exclude=["purchase_order"])
+        except DjangoValidationError as exc:
+            where = f"{label} " if label else ""
+            raise ValidationError(
+                {"items": f"{where}line {i + 1}: {exc.message_dict}"}
+            ) from exc
+        rows.append(row)
+    return rows
+
+
+def create_purchase_orders_from_proformas(entries, created_by):
+    """
+    Create one PurchaseOrder per (source_file, extracted) pair. All line items
+    are validated first; then one INSERT for the headers and one bulk INSERT
+    for every line, in a single transaction. Returns the POs in input order.
+    """
+    now = timezone.now()
+    pos, lines = [], []
+    for name, extracted in entries:
+        lines.append(_proforma_po_items(extracted, label=name))
+        pos.append(
+            PurchaseOrder(
+                po_number=None,
+                data=_proforma_po_data(extracted, created_by, source_file=name),
+                generated_at=now,
+            )
+        )
+
+    with transaction.atomic():
+        for po, number in zip(pos, po_numbers.next_po_numbers(len(pos), now)):
+            po.po_number = number
+        created = PurchaseOrder.objects.bulk_create(pos)
+        items = []
+        for po, rows in zip(created, lines):
+            for row in rows:
+                row.purchase_order = po
+                items.append(row)
+        PurchaseOrderItem.objects.bulk_create(items)
+    logger.info(
+        "created %s purchase orders (%s items) from proformas by=%s",
+        len(created),
+        len(items),
+        getattr(created_by, "id", None),
+    )
+    return created
+
+
+def create_purchase_order_from_proforma(extracted, created_by):
+    return create_purchase_orders_from_proformas([(None, extracted)], created_by)[0]
+
+
+def _extract_one(index, name, file_obj):
+    try:
+        return index, name, extract_proforma(file_obj), None
+    except Exception as exc:
+        logger.exception("batch extraction failed for %s: %s", name, exc)
+        return index, name, None, str(exc)
+    finally:
+        # worker threads open their own DB connections; don't leak them
+        close_old_connections()
+        connection.close()
+
+
+def extract_proforma_batch(files, max_workers=None):
+    """
+    Extract (name, file_obj) pairs concurrently on a bounded thread pool.
+    Yields (index, name, extracted, error) as each file finishes.
+    """
+    if max_workers is None:
+        max_workers = int(getattr(settings, "PROFORMA_BATCH_WORKERS", 4))
+    workers = max(1, min(max_workers, len(files)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="proforma") as ex:
+        futures = [
+            ex.submit(_extract_one, index, name, file_obj)
+            for index, (name, file_obj) in enumerate(files)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def enqueue_proforma_job(uploaded_file, created_by, auto_create_po=False):
+    """
+    Store the upload and queue extraction on the worker pool.
+    Returns the ProformaJob; the task is dispatched once the row is committed.
+    """
+    from .tasks import run_proforma_job as run_proforma_job_task
+
+    job = ProformaJob.objects.create(
+        file=uploaded_file,
+        auto_create_po=bool(auto_create_po),
+        created_by=created_by,
+    )
+    job_id = str(job.id)
+    transaction.on_commit(lambda: run_proforma_job_task.delay(job_id))
+    logger.info(
+        "proforma job queued id=%s by=%s", job_id, getattr(created_by, "id", None)
+    )
+    return job
+
+
+def run_proforma_job(job_id):
+    """
+    Run extraction (and optional PO creation) for a queued job.
+    Only a QUEUED job is claimed, so redelivered tasks do not run twice.
+    """
+    QUEUED = ProformaJob.Status.QUEUED
+    claimed = ProformaJob.objects.filter(id=job_id, status=QUEUED).update(
+        status=ProformaJob.Status.RUNNING, started_at=timezone.now()
+    )
+    if not claimed:
+        logger.info("proforma job %s not queued anymore, skipping", job_id)
+        return None
+
+    job = ProformaJob.objects.select_related("created_by").get(id=job_id)
+    try:
+        with job.file.open("rb") as fh:
+            extracted = extract_proforma(fh)
+        job.result = extracted
+        if job.auto_create_po:
+            job.purchase_order = create_purchase_order_from_proforma(
+                extracted, created_by=job.created_by
+            )
+        job.status = ProformaJob.Status.SUCCEEDED
+    except Exception as exc:
+        logger.exception("proforma job %s failed: %s", job_id, exc)
+        job.status = ProformaJob.Status.FAILED
+        job.error = str(exc)
+
+    job.finished_at = timezone.now()
+    job.save(
+        update_fields=["status", "result", "error", "purchase_order", "finished_at"]
+    )
+    return job
 
 
 def validate_receipt_against_pr(receipt_file, purchase_request):
-    extracted = process_proforma_file(receipt_file)
+    extracted = extract_proforma(receipt_file)
     discrepancies = []
     rec_total = extracted.get("total_amount")
     pr_total = purchase_request.total_amount
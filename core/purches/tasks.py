@@ -0,0 +1,22 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="purches.run_proforma_job")
+def run_proforma_job(job_id):
+    from core.purches import services
+
+    logger.debug("run_proforma_job picked up job=%s", job_id)
+    services.run_proforma_job(job_id)
+
+
+@shared_task(name="purches.drain_outbox")
+def drain_outbox():
+    from core.purches import outbox
+
+    processed = outbox.drain()
+    logger.debug("drain_outbox processed %s events", processed)
+    return processed
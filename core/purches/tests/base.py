@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+
+from core.purches.models import PurchaseRequest, RequestItem
+
+
+def make_user(email, role="staff", **extra):
+    return get_user_model().objects.create_user(
+        email, "pass", role=role, is_active=True, **extra
+    )
+
+
+def make_request(created_by, title="Laptops", items=1, **extra):
+    pr = PurchaseRequest.objects.create(
+        title=title,
+        total_amount=Decimal("100.00") * items,
+        created_by=created_by,
+        **extra,
+    )
+    RequestItem.objects.bulk_create(
+        RequestItem(
+            purchase_request=pr,
+            name=f"item {i}",
+            quantity=1,
+            unit_price=Decimal("100.00"),
+        )
+        for i in range(items)
+    )
+    return pr
@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+
+from core.purches import outbox, services
+from core.purches.models import Approval, OutboxEvent, PurchaseOrder
+
+from .base import make_request, make_user
+
+THREADS = 8
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class ConcurrentApprovalTests(TransactionTestCase):
+    """Many approvers acting on one request at once; the row lock serializes them."""
+
+    def setUp(self):
+        self.staff = make_user("staff@example.com")
+        self.pr = make_request(self.staff, items=3)
+
+    def _race(self, role, level):
+        approvers = [
+            make_user(f"{role}-{i}@example.com", role=role) for i in range(THREADS)
+        ]
+        barrier = threading.Barrier(THREADS)
+
+        def approve(user):
+            try:
+                barrier.wait()
+                return services.approve_purchase_request(user, self.pr, level)[1]
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            return sorted(pool.map(approve, approvers))
+
+    def test_one_approval_per_level_and_a_single_purchase_order(self):
+        codes = self._race("approver1", 1)
+        self.assertEqual(codes.count(200), 1, codes)
+        self.assertTrue(all(code in (200, 403) for code in codes), codes)
+
+        codes = self._race("approver2", 2)
+        self.assertEqual(codes.count(200), 1, codes)
+        self.assertTrue(all(code in (200, 400) for code in codes), codes)
+
+        # normally already drained eagerly by the winning thread on commit
+        outbox.drain()
+        self.assertEqual(Approval.objects.filter(level=1).count(), 1)
+        self.assertEqual(Approval.objects.filter(level=2).count(), 1)
+        self.assertEqual(OutboxEvent.objects.count(), 1)
+        self.assertEqual(PurchaseOrder.objects.count(), 1)
+        self.pr.refresh_from_db()
+        self.assertEqual(self.pr.purchase_order, PurchaseOrder.objects.get())
+
+
+class ApprovalQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com")
+        cls.approver1 = make_user("a1@example.com", role="approver1")
+        cls.approver2 = make_user("a2@example.com", role="approver2")
+
+    def test_query_budget_is_fixed(self):
+        for items in (1, 10):
+            pr = make_request(self.staff, items=items)
+            # savepoint, lock, savepoint, insert approval, release, update,
+            # release, then the items for the response
+            with self.assertNumQueries(8):
+                body, code = services.approve_purchase_request(self.approver1, pr, 1)
+            self.assertEqual(code, 200, body)
+            # the final level adds the outbox insert and a re-read of the PO id
+            with self.assertNumQueries(10):
+                body, code = services.approve_purchase_request(self.approver2, pr, 2)
+            self.assertEqual(code, 200, body)
@@ -0,0 +1,111 @@
+import datetime
+
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+
+from core.purches import services
+from core.purches.models import Approval
+
+from .base import make_request, make_user
+
+# session, user, then the one validator query; no serializer work
+NOT_MODIFIED_QUERIES = 3
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com")
+        cls.approver1 = make_user("a1@example.com", role="approver1")
+
+    def setUp(self):
+        self.pr = make_request(self.staff)
+        make_request(self.staff, title="Chairs")
+        self.client = Client()
+        self.client.force_login(self.approver1)
+        self.pending = reverse("purchase-requests-pending")
+
+    def _get(self, url, **headers):
+        return self.client.get(url, secure=True, headers=headers)
+
+    def assertNotModifiedCheaply(self, url, **headers):
+        with self.assertNumQueries(NOT_MODIFIED_QUERIES):
+            response = self._get(url, **headers)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_unchanged_list_is_not_modified(self):
+        first = self._get(self.pending)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotModifiedCheaply(self.pending, if_none_match=first["ETag"])
+
+    def test_unchanged_request_list_is_not_modified(self):
+        client = Client()
+        client.force_login(self.staff)
+        url = reverse("purchase-requests-list")
+        first = client.get(url, secure=True)
+        self.assertEqual(len(first.json()["results"]), 2)
+        with self.assertNumQueries(NOT_MODIFIED_QUERIES):
+            again = client.get(
+                url, secure=True, headers={"if_none_match": first["ETag"]}
+            )
+        self.assertEqual(again.status_code, 304)
+
+    def test_lists_send_no_last_modified(self):
+        response = self._get(self.pending)
+        self.assertIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+
+    def test_poll_after_approving_is_not_a_stale_304(self):
+        first = self._get(self.pending)
+        self.assertEqual(len(first.json()["results"]), 2)
+
+        approve = reverse("purchase-requests-approve", args=[self.pr.pk])
+        response = self.client.patch(approve, secure=True)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        # a client validating on the date alone, with a clock ahead of ours
+        later = http_date((timezone.now() + datetime.timedelta(hours=1)).timestamp())
+        polled = self._get(self.pending, if_modified_since=later)
+        self.assertEqual(polled.status_code, 200)
+        self.assertEqual(len(polled.json()["results"]), 1)
+
+        polled = self._get(self.pending, if_none_match=first["ETag"])
+        self.assertEqual(polled.status_code, 200)
+
+    def test_retrieve_keeps_last_modified(self):
+        url = reverse("purchase-requests-detail", args=[self.pr.pk])
+        response = self._get(url)
+        self.assertIn("Last-Modified", response)
+        self.assertNotModifiedCheaply(url, if_modified_since=response["Last-Modified"])
+        self.assertNotModifiedCheaply(url, if_none_match=response["ETag"])
+
+    def test_approvals_history(self):
+        url = reverse("purchase-requests-approvals", args=[self.pr.pk])
+        first = self._get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["approvals"], [])
+        self.assertIn("ETag", first)
+        self.assertNotIn("Last-Modified", first)
+        self.assertNotModifiedCheaply(url, if_none_match=first["ETag"])
+
+        services.approve_purchase_request(self.approver1, self.pr, 1)
+        second = self._get(url, if_none_match=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(len(second.json()["approvals"]), 1)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+        self.assertNotModifiedCheaply(url, if_none_match=second["ETag"])
+
+        # a new Approval row alone, without touching the request
+        Approval.objects.create(
+            purchase_request=self.pr,
+            approver=self.staff,
+            level=2,
+            decision=Approval.Decision.APPROVED,
+        )
+        third = self._get(url, if_none_match=second["ETag"])
+        self.assertEqual(third.status_code, 200)
+        self.assertEqual(len(third.json()["approvals"]), 2)
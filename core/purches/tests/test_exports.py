@@ -0,0 +1,166 @@
+import csv
+import datetime
+import io
+import json
+
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core.purches.models import PurchaseRequest, Receipt
+
+from .base import make_request, make_user
+
+
+def _at(day, hour):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time(hour)))
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com")
+        cls.finance = make_user("finance@example.com", role="finance")
+        cls.day = datetime.date(2025, 3, 10)
+
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.finance)
+
+    def _export(self, name, accept=None, **params):
+        headers = {"accept": accept} if accept else {}
+        response = self.client.get(reverse(name), params, secure=True, headers=headers)
+        if response.streaming:
+            response.body = b"".join(response.streaming_content)
+        return response
+
+    def _csv_rows(self, response):
+        return list(csv.reader(io.StringIO(response.body.decode())))
+
+    def test_other_roles_are_forbidden(self):
+        for role in ("staff", "approver1", "approver2"):
+            client = Client()
+            client.force_login(make_user(f"{role}-x@example.com", role=role))
+            response = client.get(reverse("export-receipts"), secure=True)
+            self.assertEqual(response.status_code, 403, role)
+
+    def test_date_to_before_date_from_is_rejected(self):
+        response = self._export(
+            "export-purchase-requests", date_from="2025-03-10", date_to="2025-03-09"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("date_to", response.json())
+
+    def test_accept_header_does_not_cause_406(self):
+        make_request(self.staff)
+        for accept, output, content_type in (
+            ("text/csv", "csv", "text/csv; charset=utf-8"),
+            ("application/x-ndjson", "ndjson", "application/x-ndjson"),
+        ):
+            with self.subTest(accept):
+                response = self._export(
+                    "export-purchase-requests", accept=accept, output=output
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response["Content-Type"], content_type)
+
+    def test_date_range_is_inclusive_and_status_filters(self):
+        before = make_request(self.staff, title="before")
+        first = make_request(self.staff, title="first")
+        last = make_request(self.staff, title="last")
+        after = make_request(self.staff, title="after")
+        rejected = make_request(
+            self.staff, title="rejected", status=PurchaseRequest.Status.REJECTED
+        )
+        next_day = self.day + datetime.timedelta(days=1)
+        for pr, when in (
+            (before, _at(self.day - datetime.timedelta(days=1), 23)),
+            (first, _at(self.day, 0)),
+            (last, _at(next_day, 23)),
+            (after, _at(next_day + datetime.timedelta(days=1), 0)),
+            (rejected, _at(self.day, 12)),
+        ):
+            PurchaseRequest.objects.filter(pk=pr.pk).update(created_at=when)
+
+        response = self._export(
+            "export-purchase-requests",
+            output="ndjson",
+            date_from=self.day.isoformat(),
+            date_to=next_day.isoformat(),
+            status=PurchaseRequest.Status.PENDING,
+        )
+        titles = [json.loads(line)["title"] for line in response.body.splitlines()]
+        self.assertEqual(titles, ["first", "last"])
+
+    def test_csv_header_and_rows(self):
+        pr = make_request(self.staff, title='Laptops, 15"', items=2)
+        response = self._export("export-purchase-requests")
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn(
+            'filename="purchase-requests.csv"', response["Content-Disposition"]
+        )
+
+        header, *rows = self._csv_rows(response)
+        self.assertEqual(header[0], "id")
+        self.assertEqual(len(rows), 1)
+        row = dict(zip(header, rows[0]))
+        self.assertEqual(row["id"], str(pr.pk))
+        self.assertEqual(row["title"], 'Laptops, 15"')
+        self.assertEqual(row["total_amount"], "200.00")
+        self.assertEqual(len(json.loads(row["items"])), 2)
+
+    def test_ndjson_lines(self):
+        prs = [make_request(self.staff, title=f"PR {i}") for i in range(3)]
+        response = self._export("export-purchase-requests", output="ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertTrue(response.body.endswith(b"\n"))
+        lines = [json.loads(line) for line in response.body.splitlines()]
+        self.assertEqual([line["id"] for line in lines], [pr.pk for pr in prs])
+
+    def test_csv_cells_cannot_start_formulas(self):
+        pr = make_request(self.staff, title='=HYPERLINK("http://x","y")')
+        for value in ("+1", "-1", "@SUM(A1)", "\tx", "\rx"):
+            Receipt.objects.create(
+                purchase_request=pr, uploaded_by=self.staff, vendor=value, note=None
+            )
+        header, *rows = self._csv_rows(self._export("export-receipts"))
+        vendors = [dict(zip(header, row))["vendor"] for row in rows]
+        self.assertEqual(vendors, ["'+1", "'-1", "'@SUM(A1)", "'\tx", "'\rx"])
+
+        header, *rows = self._csv_rows(self._export("export-purchase-requests"))
+        self.assertEqual(rows[0][header.index("title")], '\'=HYPERLINK("http://x","y")')
+
+        # NDJSON is data, not a spreadsheet: values stay as entered
+        response = self._export("export-purchase-requests", output="ndjson")
+        self.assertEqual(json.loads(response.body)["title"], pr.title)
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_rows_span_chunk_boundaries(self):
+        prs = [make_request(self.staff, title=f"PR {i}", items=i % 2) for i in range(5)]
+        for output in ("csv", "ndjson"):
+            with self.subTest(output):
+                response = self._export("export-purchase-requests", output=output)
+                if output == "csv":
+                    ids = [int(row[0]) for row in self._csv_rows(response)[1:]]
+                else:
+                    ids = [
+                        json.loads(line)["id"] for line in response.body.splitlines()
+                    ]
+                self.assertEqual(ids, [pr.pk for pr in prs])
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_queries_are_fixed_per_chunk(self):
+        def count():
+            with CaptureQueriesContext(connection) as queries:
+                self._export("export-purchase-requests", output="ndjson")
+            return len(queries)
+
+        make_request(self.staff, items=3)
+        one_chunk = count()
+        for _ in range(4):
+            make_request(self.staff, items=3)
+        # 5 rows are 3 chunks: one items query for each extra chunk
+        self.assertEqual(count(), one_chunk + 2)
@@ -0,0 +1,38 @@
+import io
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from core.purches import services
+
+EXTRACTED = {"vendor": "ACME", "total_amount": Decimal("10.00"), "items": []}
+
+
+class ExtractionCacheTests(TestCase):
+    def _extract(self):
+        return services.extract_proforma(io.BytesIO(b"%PDF-1.4 same bytes"))
+
+    @mock.patch.object(services, "process_proforma_file", return_value=EXTRACTED)
+    def test_identical_bytes_are_parsed_once(self, process):
+        self.assertEqual(self._extract(), EXTRACTED)
+        self.assertEqual(self._extract(), EXTRACTED)
+        self.assertEqual(process.call_count, 1)
+
+    @mock.patch.object(services, "process_proforma_file", return_value=EXTRACTED)
+    def test_changed_extraction_settings_miss_the_cache(self, process):
+        self._extract()
+        templates = [{"name": "acme", "fingerprint": r"ACME", "vendor": "ACME Ltd"}]
+        with override_settings(PROFORMA_VENDOR_TEMPLATES=templates):
+            self._extract()
+        with override_settings(PROFORMA_OCR_DPI=200):
+            self._extract()
+        self.assertEqual(process.call_count, 3)
+
+    def test_version_fits_the_cache_column(self):
+        self.assertLessEqual(len(services.extractor_version()), 20)
+        self.assertTrue(
+            services.extractor_version().startswith(
+                services.PROFORMA_EXTRACTOR_VERSION + "-"
+            )
+        )
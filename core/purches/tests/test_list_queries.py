@@ -0,0 +1,108 @@
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.purches.models import Approval, PurchaseOrder, PurchaseRequest, Receipt
+
+from .base import make_request, make_user
+
+
+def _rows(body):
+    """Length of the first list in a list response, paginated or not."""
+    if isinstance(body, list):
+        return len(body)
+    return next((len(v) for v in body.values() if isinstance(v, list)), 0)
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class ListEndpointQueryTests(TestCase):
+    """
+    Every list endpoint, as each role that sees rows in it, runs the same
+    number of queries with one row of fixtures as with `rows` rows.
+    """
+
+    rows = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com")
+        cls.approver1 = make_user("a1@example.com", role="approver1")
+        cls.approver2 = make_user("a2@example.com", role="approver2")
+        cls.finance = make_user("finance@example.com", role="finance")
+        cls.list_endpoints = [
+            (cls.staff, "purchase-requests-list"),
+            (cls.approver1, "purchase-requests-list"),
+            (cls.finance, "purchase-requests-list"),
+            (cls.approver1, "purchase-requests-pending"),
+            (cls.finance, "purchaseorder-list"),
+            (cls.approver1, "my-approved-requests"),
+            (cls.approver1, "my-rejected-requests"),
+            (cls.staff, "receipt-list"),
+            (cls.finance, "receipt-list"),
+            (cls.staff, "approved-receipts"),
+            (cls.finance, "approved-receipts"),
+        ]
+
+    def populate(self, n):
+        """Add `n` rows to every list in `list_endpoints`."""
+        for _ in range(n):
+            make_request(self.staff, title="pending", items=2)
+
+            approved = make_request(
+                self.staff,
+                title="approved",
+                items=2,
+                status=PurchaseRequest.Status.APPROVED,
+                current_approval_level=None,
+            )
+            Approval.objects.bulk_create(
+                Approval(
+                    purchase_request=approved,
+                    approver=approver,
+                    level=level,
+                    decision=Approval.Decision.APPROVED,
+                )
+                for level, approver in ((1, self.approver1), (2, self.approver2))
+            )
+            po = PurchaseOrder(
+                po_number=f"PO-TEST-{approved.pk}", purchase_request=approved
+            )
+            po.set_approver(self.approver2)
+            po.save()
+            approved.purchase_order = po
+            approved.save(update_fields=["purchase_order"])
+            Receipt.objects.create(
+                purchase_request=approved, uploaded_by=self.staff, vendor="ACME"
+            )
+
+            rejected = make_request(
+                self.staff, title="rejected", status=PurchaseRequest.Status.REJECTED
+            )
+            Approval.objects.create(
+                purchase_request=rejected,
+                approver=self.approver1,
+                level=1,
+                decision=Approval.Decision.REJECTED,
+            )
+
+    def _get(self, user, name):
+        client = Client()
+        client.force_login(user)
+        response = client.get(reverse(name), secure=True)
+        self.assertEqual(response.status_code, 200, response.content)
+        return _rows(response.json())
+
+    def test_list_queries_do_not_grow_with_rows(self):
+        self.populate(1)
+        budgets = {}
+        for user, name in self.list_endpoints:
+            with CaptureQueriesContext(connection) as queries:
+                self.assertGreaterEqual(self._get(user, name), 1, name)
+            budgets[user.pk, name] = len(queries)
+
+        self.populate(self.rows - 1)
+        for user, name in self.list_endpoints:
+            with self.subTest(user=user.email, endpoint=name):
+                with self.assertNumQueries(budgets[user.pk, name]):
+                    self.assertGreaterEqual(self._get(user, name), self.rows)
@@ -0,0 +1,25 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.purches import metrics, triage
+
+
+class MetricsTests(TestCase):
+    def test_counters_are_shared_through_the_database(self):
+        triage.record_route(triage.TEXT)
+        triage.record_route(triage.TEXT)
+        triage.record_pages({triage.OCR: 3})
+
+        counts = metrics.get_counts(triage.route_metric_names())
+        self.assertEqual(counts[f"proforma.route.{triage.TEXT}"], 2)
+        self.assertEqual(counts[f"proforma.pages.{triage.OCR}"], 3)
+
+    def test_command_prints_and_resets(self):
+        metrics.increment(f"proforma.route.{triage.OCR}", 4)
+        out = StringIO()
+        call_command("proforma_metrics", "--reset", stdout=out)
+        self.assertIn(f"proforma.route.{triage.OCR}: 4", out.getvalue())
+        counts = metrics.get_counts([f"proforma.route.{triage.OCR}"])
+        self.assertEqual(counts[f"proforma.route.{triage.OCR}"], 0)
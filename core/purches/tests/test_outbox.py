@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.conf import settings
+from django.db import OperationalError
+from django.test import TestCase
+
+from core.celery import app
+from core.purches import services, tasks
+from core.purches.models import OutboxEvent, PurchaseRequest
+
+from .base import make_request, make_user
+
+
+class FinalApprovalOutboxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user("staff@example.com")
+        cls.approver1 = make_user("a1@example.com", role="approver1")
+        cls.approver2 = make_user("a2@example.com", role="approver2")
+
+    def setUp(self):
+        self.pr = make_request(self.staff)
+        services.approve_purchase_request(self.approver1, self.pr, 1)
+
+    def _approve_final(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            body, code = services.approve_purchase_request(self.approver2, self.pr, 2)
+        return body, code, callbacks
+
+    @mock.patch.object(tasks.drain_outbox, "delay")
+    def test_final_approval_records_one_event_and_one_drain(self, delay):
+        body, code, callbacks = self._approve_final()
+
+        self.assertEqual(code, 200, body)
+        self.assertEqual(OutboxEvent.objects.count(), 1)
+        self.assertEqual(len(callbacks), 1)
+        delay.assert_called_once_with()
+
+    @mock.patch.object(
+        tasks.drain_outbox, "delay", side_effect=OperationalError("broker down")
+    )
+    def test_broker_outage_does_not_fail_a_committed_approval(self, delay):
+        with self.assertLogs("core.purches.outbox", "WARNING"):
+            body, code, _ = self._approve_final()
+
+        self.assertEqual(code, 200, body)
+        self.pr.refresh_from_db()
+        self.assertEqual(self.pr.status, PurchaseRequest.Status.APPROVED)
+        event = OutboxEvent.objects.get()
+        self.assertIsNone(event.processed_at)
+
+        # the periodic drain picks the event up later
+        self.assertEqual(tasks.drain_outbox(), 1)
+        self.pr.refresh_from_db()
+        self.assertIsNotNone(self.pr.purchase_order_id)
+
+    def test_admin_approval_still_queues_a_purchase_order(self):
+        pr = make_request(self.staff)
+        pr.status = PurchaseRequest.Status.APPROVED
+        pr.current_approval_level = None
+        with self.captureOnCommitCallbacks(execute=True):
+            pr.save()
+        pr.refresh_from_db()
+        self.assertIsNotNone(pr.purchase_order_id)
+
+    def test_beat_schedule_drains_the_outbox(self):
+        entry = settings.CELERY_BEAT_SCHEDULE["drain-outbox"]
+        self.assertIn(entry["task"], app.tasks)
+        self.assertEqual(app.tasks[entry["task"]], tasks.drain_outbox)
@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.purches import po_numbers, services
+from core.purches.models import PurchaseOrder, PurchaseOrderItem
+
+
+def _extracted(lines):
+    return {
+        "vendor": "ACME",
+        "total_amount": Decimal("10.00") * lines,
+        "items": [
+            {"name": f"item {i}", "quantity": 2, "unit_price": Decimal("5.00")}
+            for i in range(lines)
+        ],
+    }
+
+
+# one sequence fetch per call on PostgreSQL, whatever the batch size
+@override_settings(PO_NUMBER_BLOCK_SIZE=1)
+class CreatePurchaseOrdersFromProformasTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            "finance@example.com", "pass", role="finance", is_active=True
+        )
+
+    def setUp(self):
+        po_numbers._block.clear()
+        # first allocation creates the counter row on other backends
+        services.create_purchase_orders_from_proformas(
+            [("warmup.pdf", _extracted(1))], self.user
+        )
+
+    def _create(self, proformas, lines):
+        entries = [(f"p{i}.pdf", _extracted(lines)) for i in range(proformas)]
+        return services.create_purchase_orders_from_proformas(entries, self.user)
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        with CaptureQueriesContext(connection) as single:
+            self._create(1, 1)
+        with self.assertNumQueries(len(single)):
+            created = self._create(10, 3)
+
+        self.assertEqual(len(created), 10)
+        self.assertEqual(len({po.po_number for po in created}), 10)
+        self.assertEqual(
+            PurchaseOrderItem.objects.filter(purchase_order__in=created).count(), 30
+        )
+
+    def test_items_belong_to_their_own_order(self):
+        created = self._create(3, 2)
+        for po in created:
+            self.assertEqual(po.items.count(), 2)
+        self.assertEqual(PurchaseOrder.objects.count(), 4)
@@ -0,0 +1,23 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from core.purches import po_numbers
+
+
+class AllocateTests(TestCase):
+    def setUp(self):
+        po_numbers._block.clear()
+
+    def test_values_are_unique_and_ascending_per_call(self):
+        first = po_numbers.allocate(5)
+        second = po_numbers.allocate(3)
+        self.assertEqual(first, sorted(first))
+        self.assertEqual(len(set(first + second)), 8)
+
+    def test_benchmark_refuses_other_backends(self):
+        if connection.vendor == "postgresql":
+            self.skipTest("the benchmark runs on PostgreSQL")
+        with self.assertRaisesMessage(CommandError, "needs PostgreSQL"):
+            call_command("benchmark_po_numbers", "--count", "1")
@@ -0,0 +1,50 @@
+import unittest
+
+from django.db import connection, transaction
+from django.test import TestCase
+
+from core.purches.management.commands.explain_hot_queries import (
+    SEQ_SCAN,
+    hot_queries,
+)
+
+from .base import make_user
+
+
+class HotQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            make_user(f"{role}@example.com", role=role)
+            for role in ("staff", "approver1", "approver2", "finance")
+        ]
+        # no role: the superuser branch of the request list
+        admin = make_user("admin@example.com", is_superuser=True)
+        admin.role = ""
+        cls.users.append(admin)
+
+    def _queries(self):
+        for user in self.users:
+            yield from hot_queries(user).items()
+
+    def test_queries_come_from_the_views(self):
+        labels = [label for label, _ in self._queries()]
+        self.assertIn("requests: pending (approver2)", labels)
+        self.assertIn("requests (superuser)", labels)
+        self.assertNotIn("requests: pending (staff)", labels)
+        pending = dict(self._queries())["requests: pending (approver2)"]
+        self.assertIn("current_approval_level", str(pending.query))
+
+    @unittest.skipUnless(
+        connection.vendor == "postgresql", "plan shapes are checked on PostgreSQL"
+    )
+    def test_hot_queries_can_use_an_index(self):
+        with transaction.atomic():
+            # empty tables make seq scans cheapest; only ask whether an index
+            # can serve each access path
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            for label, qs in self._queries():
+                with self.subTest(label):
+                    plan = qs.explain()
+                    self.assertEqual(SEQ_SCAN["postgresql"].findall(plan), [], plan)
@@ -0,0 +1,146 @@
+import datetime
+import decimal
+import io
+import uuid
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from core.purches import renderers as fast
+from core.purches.models import PurchaseOrder, PurchaseRequest
+from core.purches.serializers.purchase_order import PurchaseOrderSerializer
+from core.purches.serializers.purchase_request import PurchaseRequestSerializer
+
+from .base import make_request, make_user
+
+UTC = datetime.timezone.utc
+MEDIA_TYPES = ("application/json", "application/json; indent=4")
+
+
+def render_cases():
+    """One edge per case, so a fallback for one can't mask another."""
+    aware = datetime.datetime(2025, 3, 1, 12, 30, 5, 120, tzinfo=UTC)
+    return {
+        "decimals": [decimal.Decimal("12.50"), decimal.Decimal("-3.14159")],
+        "decimal zero": {"total": decimal.Decimal("0")},
+        "decimal large": {"total": decimal.Decimal("1E+20")},
+        "decimal small": {"total": decimal.Decimal("0.00001")},
+        "datetime utc": {"at": aware},
+        "datetime no microseconds": {"at": aware.replace(microsecond=0)},
+        "datetime offset": {"at": aware.astimezone(ZoneInfo("Africa/Kigali"))},
+        "datetime naive": {"at": datetime.datetime(2025, 3, 1, 12, 30)},
+        "date": {"on": datetime.date(2025, 3, 1)},
+        "time": {"at": datetime.time(8, 15, 30, 5)},
+        "timedelta": {"took": datetime.timedelta(days=1, seconds=3)},
+        "lazy string": {"label": gettext_lazy("Purchase Request"), "n": 1},
+        "choices": [PurchaseRequest.Status.PENDING, PurchaseRequest.Status.APPROVED],
+        "unicode": "Ndizeye – café ✓ 😀",
+        "line separators": "a\u2028b\u2029c",
+        "control characters": '\x00\x1f\x7f "q" \\ / \n\t',
+        "ints": [0, -1, 2**63 - 1, -(2**63), 2**64 - 1],
+        "int beyond 64 bits": [2**64 + 1],
+        "floats": [0.1, 1.5, -0.0, 123.456, 0.0001, 1e15],
+        "float small": [1e-5],
+        "float large": [1e16],
+        "float negative exponent": [1.23e-10],
+        "int keys": {1: "a", 2: "b"},
+        "mixed keys": {2.5: "b", False: "c", None: "d"},
+        "tuple": (1, 2),
+        "set": {3},
+        "bytes": {"raw": b"raw"},
+        "uuid": {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+        "serializer containers": ReturnDict(
+            {"x": ReturnList([1, {"y": None}], serializer=None)}, serializer=None
+        ),
+        "text that looks numeric": ["e1", "3e5a", "10.00000", "1e-5"],
+        "empty": {},
+        "bools": [True, False, None],
+    }
+
+
+def parse_cases():
+    return {
+        "object": b'{"title": "Laptops", "items": [{"quantity": 2, "price": "1.5"}]}',
+        "unicode": '{"name": "café ✓ 😀", "esc": "\\u00e9\\n"}'.encode(),
+        "big int": b'{"n": 123456789012345678901234567890}',
+        "floats": b"[0.1, 1e16, 1E-7, -0.0, 2.5e+3]",
+        "duplicate keys": b'{"a": 1, "a": 2}',
+        "lone surrogate": b'{"s": "\\ud800"}',
+        "nan": b'{"x": NaN}',
+        "infinity": b"[Infinity]",
+        "bom": b'\xef\xbb\xbf{"a": 1}',
+        "invalid": b'{"a": }',
+        "empty": b"",
+        "scalar": b"42",
+    }
+
+
+def _rendered(renderer, data, media_type):
+    try:
+        return renderer.render(data, media_type)
+    except (TypeError, ValueError) as exc:
+        return repr(exc)
+
+
+def _parsed(parser, body):
+    try:
+        return ("ok", parser.parse(io.BytesIO(body), parser_context={}))
+    except ParseError as exc:
+        return ("error", str(exc.detail))
+
+
+class RendererGoldenMixin:
+    def assertRendersLikeDRF(self, cases):
+        golden, candidate = renderers.JSONRenderer(), fast.JSONRenderer()
+        for label, data in cases.items():
+            for media_type in MEDIA_TYPES:
+                with self.subTest(label, media_type=media_type):
+                    self.assertEqual(
+                        _rendered(candidate, data, media_type),
+                        _rendered(golden, data, media_type),
+                    )
+
+
+class JSONRendererTests(RendererGoldenMixin, SimpleTestCase):
+    def test_output_is_byte_identical_to_drf(self):
+        self.assertRendersLikeDRF(render_cases())
+
+    def test_none_renders_empty(self):
+        self.assertEqual(fast.JSONRenderer().render(None), b"")
+
+
+class JSONParserTests(SimpleTestCase):
+    def test_results_and_errors_match_drf(self):
+        golden, candidate = parsers.JSONParser(), fast.JSONParser()
+        for label, body in parse_cases().items():
+            with self.subTest(label):
+                # repr, so that -0.0 vs 0.0 and int vs float count as differences
+                self.assertEqual(
+                    repr(_parsed(candidate, body)), repr(_parsed(golden, body))
+                )
+
+
+class ListPageRenderingTests(RendererGoldenMixin, TestCase):
+    def test_list_pages_are_byte_identical_to_drf(self):
+        staff = make_user("staff@example.com")
+        for i in range(3):
+            pr = make_request(staff, title=f"Request {i}", items=i + 1)
+            PurchaseOrder.objects.create(
+                po_number=f"PO-TEST-{pr.pk}",
+                purchase_request=pr,
+                data={"total": "12.50", "items": [{"name": "café ✓", "qty": 2}]},
+            )
+        prs = PurchaseRequestSerializer.setup_eager_loading(
+            PurchaseRequest.objects.order_by("-created_at", "-id")
+        )
+        pos = PurchaseOrder.objects.order_by("-generated_at", "-id")
+        self.assertRendersLikeDRF(
+            {
+                "purchase request page": PurchaseRequestSerializer(prs, many=True).data,
+                "purchase order page": PurchaseOrderSerializer(pos, many=True).data,
+            }
+        )
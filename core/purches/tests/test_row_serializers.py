@@ -0,0 +1,183 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from core.purches.models import Approval, PurchaseOrder, PurchaseRequest, Receipt
+from core.purches.serializers.approval import (
+    ApprovalRowSerializer,
+    MyApprovalRowSerializer,
+    MyApprovalSerializer,
+    RejectedApprovalRowSerializer,
+)
+from core.purches.serializers.purchase_order import (
+    PurchaseOrderRowSerializer,
+    PurchaseOrderSerializer,
+)
+from core.purches.serializers.purchase_request import (
+    PurchaseRequestRowSerializer,
+    PurchaseRequestSerializer,
+)
+from core.purches.serializers.receipt import ReceiptRowSerializer, ReceiptSerializer
+
+from .base import make_request, make_user
+
+APPROVED = Approval.Decision.APPROVED
+REJECTED = Approval.Decision.REJECTED
+
+
+def _render(data):
+    return JSONRenderer().render(data)
+
+
+def _approval_history(pr, pr_data):
+    """The approvals action's response rows as built before row serializers."""
+    result = []
+    for a in pr.approvals.all().select_related("approver"):
+        first = a.approver.first_name or ""
+        last = a.approver.last_name or ""
+        result.append(
+            {
+                "id": a.id,
+                "level": a.level,
+                "decision": a.decision,
+                "comment": a.comment,
+                "created_at": a.created_at,
+                "approver_id": a.approver_id,
+                "purchase_request_id": a.purchase_request_id,
+                "approver_name": f"{first} {last}".strip() or None,
+                "purchase_request": pr_data,
+            }
+        )
+    return result
+
+
+def _rejections(approvals):
+    """approvals/mine/rejected rows as built before row serializers."""
+    result = []
+    for a in approvals.select_related("purchase_request", "approver"):
+        first, last = a.approver.first_name, a.approver.last_name
+        result.append(
+            {
+                "id": a.id,
+                "level": a.level,
+                "decision": a.decision,
+                "comment": a.comment,
+                "created_at": a.created_at,
+                "approver_id": a.approver_id,
+                "purchase_request_id": a.purchase_request_id,
+                "approver_name": " ".join(n for n in (first, last) if n).strip(),
+                "purchase_request": PurchaseRequestSerializer(a.purchase_request).data,
+                "purchase_request_rejected": (
+                    a.purchase_request.status == PurchaseRequest.Status.REJECTED
+                ),
+            }
+        )
+    return result
+
+
+class RowSerializerOutputTests(TestCase):
+    """Each row serializer renders the same bytes as the code it replaced."""
+
+    @classmethod
+    def setUpTestData(cls):
+        staff = make_user("staff@example.com", first_name="Ana", last_name="K")
+        # blank names on both sides, and only a first name
+        cls.nameless = make_user("a1@example.com", role="approver1")
+        cls.first_only = make_user("a2@example.com", role="approver2", first_name="Béa")
+
+        cls.no_items = make_request(staff, title="No items", items=0)
+        cls.approved = make_request(
+            staff,
+            title="Laptops",
+            description='two 15" units',
+            items=2,
+            status=PurchaseRequest.Status.APPROVED,
+            current_approval_level=None,
+        )
+        cls.rejected = make_request(
+            staff, title="Chairs", status=PurchaseRequest.Status.REJECTED
+        )
+        cls.approved.items.update(unit_price=Decimal("1234.5"))
+
+        for pr, approver, level, decision, comment in (
+            (cls.approved, cls.nameless, 1, APPROVED, ""),
+            (cls.approved, cls.first_only, 2, APPROVED, "ok ✓"),
+            (cls.rejected, cls.nameless, 1, REJECTED, "too expensive"),
+            (cls.no_items, cls.first_only, 1, REJECTED, ""),
+        ):
+            Approval.objects.create(
+                purchase_request=pr,
+                approver=approver,
+                level=level,
+                decision=decision,
+                comment=comment,
+            )
+
+        snapshot = PurchaseOrder(po_number="PO-1", purchase_request=cls.approved)
+        snapshot.set_approver(cls.first_only)
+        snapshot.save()
+        # legacy rows: approver from Approval rows, from embedded data, or none
+        PurchaseOrder.objects.create(po_number="PO-2", purchase_request=cls.approved)
+        PurchaseOrder.objects.create(
+            po_number="PO-3",
+            data={
+                "approvals": [
+                    {"level": 2, "decision": APPROVED, "approver": cls.nameless.pk}
+                ]
+            },
+        )
+        PurchaseOrder.objects.create(po_number="PO-4", data={"total": "1.50"})
+
+        Receipt.objects.create(purchase_request=cls.approved, uploaded_by=staff)
+        Receipt.objects.create(
+            purchase_request=cls.approved,
+            uploaded_by=staff,
+            file_url="https://example.com/r.pdf",
+            vendor="ACME",
+            note="paid",
+        )
+
+    def assertSameOutput(self, model_serializer, row_serializer, qs, context=None):
+        setup = getattr(model_serializer, "setup_eager_loading", None)
+        expected = model_serializer(
+            setup(qs) if setup else qs, many=True, context=context or {}
+        ).data
+        got = row_serializer(context).serialize(qs)
+        self.assertEqual(_render(got), _render(expected))
+
+    def test_purchase_requests(self):
+        qs = PurchaseRequest.objects.order_by("-created_at", "-id")
+        self.assertSameOutput(
+            PurchaseRequestSerializer, PurchaseRequestRowSerializer, qs
+        )
+
+    def test_purchase_orders(self):
+        qs = PurchaseOrder.objects.order_by("-generated_at", "-id")
+        self.assertSameOutput(PurchaseOrderSerializer, PurchaseOrderRowSerializer, qs)
+
+    def test_my_approvals(self):
+        for user in (self.nameless, self.first_only):
+            qs = Approval.objects.filter(approver=user).order_by("-created_at", "-id")
+            self.assertSameOutput(MyApprovalSerializer, MyApprovalRowSerializer, qs)
+
+    def test_receipts(self):
+        qs = Receipt.objects.order_by("-uploaded_at", "-id")
+        self.assertSameOutput(ReceiptSerializer, ReceiptRowSerializer, qs)
+
+    def test_approval_history(self):
+        for pr in (self.approved, self.rejected, self.no_items):
+            pr_data = PurchaseRequestSerializer(pr).data
+            got = ApprovalRowSerializer({"purchase_request": pr_data}).serialize(
+                pr.approvals.all()
+            )
+            self.assertEqual(_render(got), _render(_approval_history(pr, pr_data)))
+
+    def test_rejections(self):
+        for user in (self.nameless, self.first_only):
+            qs = Approval.objects.filter(approver=user, decision=REJECTED).order_by(
+                "-created_at", "-id"
+            )
+            got = RejectedApprovalRowSerializer({}).serialize(qs)
+            self.assertEqual(len(got), 1)
+            self.assertEqual(_render(got), _render(_rejections(qs)))
@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase, override_settings
+
+from core.purches import extractors
+
+ACME = [{"name": "acme", "fingerprint": r"ACME Ltd", "vendor": "ACME Ltd"}]
+GLOBEX = [{"name": "globex", "fingerprint": r"ACME Ltd", "vendor": "Globex"}]
+
+
+class VendorTemplateSettingsTests(SimpleTestCase):
+    def test_templates_follow_the_setting(self):
+        text = "ACME Ltd\nInvoice No: 42"
+        with override_settings(PROFORMA_VENDOR_TEMPLATES=ACME):
+            self.assertEqual(extractors.select_template(text).vendor, "ACME Ltd")
+            with override_settings(PROFORMA_VENDOR_TEMPLATES=GLOBEX):
+                self.assertEqual(extractors.select_template(text).vendor, "Globex")
+            self.assertEqual(extractors.select_template(text).vendor, "ACME Ltd")
+        with override_settings(PROFORMA_VENDOR_TEMPLATES=[]):
+            self.assertIs(extractors.select_template(text), extractors.DEFAULT_TEMPLATE)
+
+    def test_registered_templates_come_first(self):
+        template = extractors.register_template(
+            extractors.VendorTemplate("coded", fingerprint=r"ACME", vendor="Coded")
+        )
+        self.addCleanup(extractors.unregister_template, "coded")
+        with override_settings(PROFORMA_VENDOR_TEMPLATES=ACME):
+            self.assertIs(extractors.select_template("ACME Ltd"), template)
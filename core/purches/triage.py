@@ -0,0 +1,111 @@
+import logging
+
+import pypdfium2 as pdfium
+from django.conf import settings
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+TEXT = "text"
+OCR = "ocr"
+HYBRID = "hybrid"
+ROUTES = (TEXT, OCR, HYBRID)
+
+
+def _min_chars() -> int:
+    return int(getattr(settings, "PROFORMA_TRIAGE_MIN_CHARS", 50))
+
+
+def _max_image_coverage() -> float:
+    return float(getattr(settings, "PROFORMA_TRIAGE_IMAGE_COVERAGE", 0.5))
+
+
+def classify(char_count, image_coverage) -> str:
+    """
+    OCR: page-sized images and (almost) no text layer, i.e. a scan.
+    HYBRID: a text layer plus page-sized images that may hold more text.
+    TEXT: everything else; a sparse page without images has nothing to OCR.
+    """
+    if image_coverage < _max_image_coverage():
+        return TEXT
+    if char_count < _min_chars():
+        return OCR
+    return HYBRID
+
+
+def _coverage(boxes, width, height) -> float:
+    page_area = float(width * height) or 1.0
+    covered = 0.0
+    for x0, y0, x1, y1 in boxes:
+        # clip to the page; overlapping images may push this past 1.0
+        w = max(0.0, min(x1, width) - max(x0, 0.0))
+        h = max(0.0, min(y1, height) - max(y0, 0.0))
+        covered += w * h
+    return min(covered / page_area, 1.0)
+
+
+def classify_plumber_page(page) -> str:
+    """Classify a pdfplumber page from the objects already parsed for it."""
+    boxes = [(img["x0"], img["top"], img["x1"], img["bottom"]) for img in page.images]
+    return classify(len(page.chars), _coverage(boxes, page.width, page.height))
+
+
+def _sample_indexes(page_count, sample_size):
+    if page_count <= sample_size:
+        return list(range(page_count))
+    step = (page_count - 1) / (sample_size - 1) if sample_size > 1 else 0
+    return sorted({round(i * step) for i in range(sample_size)})
+
+
+def triage_pdf(file_obj) -> str:
+    """
+    Pick the extraction route for a PDF from a few evenly spaced pages,
+    using pdfium's page objects (no layout analysis, no rendering).
+    """
+    sample_size = int(getattr(settings, "PROFORMA_TRIAGE_SAMPLE_PAGES", 3))
+    file_obj.seek(0)
+    doc = pdfium.PdfDocument(file_obj.read())
+    file_obj.seek(0)
+    routes = set()
+    try:
+        for index in _sample_indexes(len(doc), max(sample_size, 1)):
+            page = doc[index]
+            try:
+                width, height = page.get_size()
+                textpage = page.get_textpage()
+                char_count = textpage.count_chars()
+                textpage.close()
+                boxes = [
+                    obj.get_bounds()
+                    for obj in page.get_objects(filter=(pdfium.raw.FPDF_PAGEOBJ_IMAGE,))
+                ]
+            finally:
+                page.close()
+            routes.add(classify(char_count, _coverage(boxes, width, height)))
+    finally:
+        doc.close()
+
+    if len(routes) == 1:
+        route = routes.pop()
+    else:
+        route = HYBRID
+    record_route(route)
+    return route
+
+
+def record_route(route):
+    metrics.increment(f"proforma.route.{route}")
+
+
+def record_pages(page_routes):
+    """Record per-page routes (a mapping of route -> page count)."""
+    for page_route, count in page_routes.items():
+        if count:
+            metrics.increment(f"proforma.pages.{page_route}", count)
+
+
+def route_metric_names():
+    names = [f"proforma.route.{r}" for r in ROUTES + ("image",)]
+    names += [f"proforma.pages.{r}" for r in ROUTES]
+    return names
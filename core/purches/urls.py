@@ -9,6 +9,16 @@ from core.purches.views.approvals import (
     ReceiptListView,
     RequestReceiptsView,
 )
+from core.purches.views.documents import (
+    ProformaBatchUploadView,
+    ProformaJobDetailView,
+    ProformaUploadView,
+)
+from core.purches.views.exports import (
+    PurchaseOrderExportView,
+    PurchaseRequestExportView,
+    ReceiptExportView,
+)
 from core.purches.views.purchase_order import PurchaseOrderViewSet  # added import
 from core.purches.views.purchase_request import PurchaseRequestViewSet
 
@@ -43,4 +53,29 @@ urlpatterns = [
         RequestReceiptsView.as_view(),
         name="request-receipts",
     ),
+    # streaming CSV/NDJSON exports for finance (?output=&date_from=&date_to=&status=)
+    path(
+        "exports/purchase-requests/",
+        PurchaseRequestExportView.as_view(),
+        name="export-purchase-requests",
+    ),
+    path("exports/receipts/", ReceiptExportView.as_view(), name="export-receipts"),
+    path(
+        "exports/purchase-orders/",
+        PurchaseOrderExportView.as_view(),
+        name="export-purchase-orders",
+    ),
+    path("documents/proforma/", ProformaUploadView.as_view(), name="proforma-upload"),
+    # many proformas at once (multipart list or zip), streamed NDJSON results
+    path(
+        "documents/proforma/batch/",
+        ProformaBatchUploadView.as_view(),
+        name="proforma-batch-upload",
+    ),
+    # status/result of an async proforma extraction job
+    path(
+        "documents/proforma/jobs/<uuid:pk>/",
+        ProformaJobDetailView.as_view(),
+        name="proforma-job-detail",
+    ),
 ]
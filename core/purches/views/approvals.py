@@ -4,9 +4,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core.purches.models import Approval, PurchaseRequest
-from core.purches.serializers import purchase_request as purchase_request_serializer
-from core.purches.serializers.approval import MyApprovalSerializer
+from core.purches.models import Approval
+from core.purches.pagination import KeysetPaginationMixin, RowListMixin
+from core.purches.serializers.approval import (
+    MyApprovalRowSerializer,
+    MyApprovalSerializer,
+    RejectedApprovalRowSerializer,
+)
 
 from .approvals_receipts import (
     ApprovedReceiptsView,
@@ -25,22 +29,7 @@ __all__ = [
 ]
 
 
-def _build_approver_name(approval):
-    approver = getattr(approval, "approver", None)
-    if not approver:
-        return None
-    first = getattr(approver, "first_name", "")
-    last = getattr(approver, "last_name", "")
-    return " ".join(n for n in (first, last) if n).strip()
-
-
-def _is_pr_rejected(pr):
-    return getattr(pr, "status", None) == getattr(
-        PurchaseRequest.Status, "REJECTED", "REJECTED"
-    )
-
-
-class MyApprovedRequestsView(generics.ListAPIView):
+class MyApprovedRequestsView(RowListMixin, generics.ListAPIView):
     """
     Return approvals created by the authenticated user.
     This shows what approver1 / approver2 approved even if the PurchaseRequest
@@ -49,55 +38,37 @@ class MyApprovedRequestsView(generics.ListAPIView):
 
     permission_classes = (IsAuthenticated,)
     serializer_class = MyApprovalSerializer
+    row_serializer = MyApprovalRowSerializer
+    keyset_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         user = self.request.user
-        return (
-            Approval.objects.filter(approver=user)
-            .select_related("purchase_request", "approver")
-            .order_by("-created_at")
-        )
+        qs = Approval.objects.filter(approver=user).order_by("-created_at")
+        return self.get_serializer_class().setup_eager_loading(qs)
 
 
-class MyRejectedRequestsView(APIView):
+class MyRejectedRequestsView(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-created_at", "-id")
 
     @swagger_auto_schema(
         tags=["Requests"],
         security=[{"Bearer": []}],
         responses={200: "OK"},
     )
-    def get(self, request):
-        user = request.user
-        qs = (
-            Approval.objects.filter(approver=user, decision=Approval.Decision.REJECTED)
-            .select_related("purchase_request", "approver")
+    def get_queryset(self):
+        return (
+            Approval.objects.filter(
+                approver=self.request.user, decision=Approval.Decision.REJECTED
+            )
             .order_by("-created_at")
+            .values(*RejectedApprovalRowSerializer.columns())
         )
-        data = []
-        for a in qs:
-            pr = a.purchase_request
-            if pr is not None:
-                ser = purchase_request_serializer.PurchaseRequestSerializer(
-                    pr, context={"request": request}
-                )
-                pr_data = ser.data
-            else:
-                pr_data = None
 
-            data.append(
-                {
-                    "id": a.id,
-                    "level": a.level,
-                    "decision": a.decision,
-                    "comment": a.comment,
-                    "created_at": a.created_at,
-                    "approver_id": a.approver_id,
-                    "purchase_request_id": a.purchase_request_id,
-                    "approver_name": _build_approver_name(a),
-                    "purchase_request": pr_data,
-                    "purchase_request_rejected": _is_pr_rejected(pr),
-                }
-            )
-
-        return Response({"rejected_requests": data}, status=status.HTTP_200_OK)
+    def get(self, request):
+        serializer = RejectedApprovalRowSerializer({"request": request})
+        data = serializer.to_representation(self.paginate_queryset(self.get_queryset()))
+        return Response(
+            self.paginated_payload("rejected_requests", data),
+            status=status.HTTP_200_OK,
+        )
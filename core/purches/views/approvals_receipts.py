@@ -7,25 +7,23 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.purches.models import PurchaseRequest, Receipt
+from core.purches.pagination import KeysetPaginationMixin
 from core.purches.serializers import receipt as receipt_serializer
 from core.purches.utils import user_is_role
 
 
-class ApprovedReceiptsView(APIView):
+class ApprovedReceiptsView(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-uploaded_at", "-id")
 
     @swagger_auto_schema(
         tags=["Receipts"], security=[{"Bearer": []}], responses={200: "OK"}
     )
     def get(self, request):
         user = request.user
-        qs = (
-            Receipt.objects.filter(
-                purchase_request__status=PurchaseRequest.Status.APPROVED
-            )
-            .select_related("purchase_request", "uploaded_by")
-            .order_by("-uploaded_at")
-        )
+        qs = Receipt.objects.filter(
+            purchase_request__status=PurchaseRequest.Status.APPROVED
+        ).order_by("-uploaded_at")
 
         is_privileged = (
             user.is_staff or user.is_superuser or user_is_role(user, "finance")
@@ -33,25 +31,26 @@ class ApprovedReceiptsView(APIView):
         if not is_privileged:
             qs = qs.filter(Q(uploaded_by=user) | Q(purchase_request__created_by=user))
 
-        serializer = receipt_serializer.ReceiptSerializer(
-            qs, many=True, context={"request": request}
+        rows = self.paginate_queryset(
+            qs.values(*receipt_serializer.ReceiptRowSerializer.columns())
         )
+        data = receipt_serializer.ReceiptRowSerializer().to_representation(rows)
         return Response(
-            {"approved_receipts": serializer.data}, status=status.HTTP_200_OK
+            self.paginated_payload("approved_receipts", data),
+            status=status.HTTP_200_OK,
         )
 
 
-class ReceiptListView(APIView):
+class ReceiptListView(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-uploaded_at", "-id")
 
     @swagger_auto_schema(
         tags=["Receipts"], security=[{"Bearer": []}], responses={200: "OK"}
     )
     def get(self, request):
         user = request.user
-        qs = Receipt.objects.select_related(
-            "uploaded_by", "purchase_request__created_by"
-        ).order_by("-uploaded_at")
+        qs = Receipt.objects.order_by("-uploaded_at")
 
         is_privileged = (
             user.is_staff or user.is_superuser or user_is_role(user, "finance")
@@ -59,10 +58,14 @@ class ReceiptListView(APIView):
         if not is_privileged:
             qs = qs.filter(Q(uploaded_by=user) | Q(purchase_request__created_by=user))
 
-        serializer = receipt_serializer.ReceiptSerializer(
-            qs, many=True, context={"request": request}
+        rows = self.paginate_queryset(
+            qs.values(*receipt_serializer.ReceiptRowSerializer.columns())
+        )
+        data = receipt_serializer.ReceiptRowSerializer().to_representation(rows)
+        return Response(
+            self.paginated_payload("receipts", data),
+            status=status.HTTP_200_OK,
         )
-        return Response({"receipts": serializer.data}, status=status.HTTP_200_OK)
 
 
 class ReceiptDetailView(APIView):
@@ -99,21 +102,22 @@ class ReceiptDetailView(APIView):
         return Response(out, status=status.HTTP_200_OK)
 
 
-class RequestReceiptsView(APIView):
+class RequestReceiptsView(KeysetPaginationMixin, APIView):
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-uploaded_at", "-id")
 
     @swagger_auto_schema(
         tags=["Receipts"], security=[{"Bearer": []}], responses={200: "OK"}
     )
     def get(self, request, pk):
         pr = get_object_or_404(PurchaseRequest, pk=pk)
-        receipts = (
-            Receipt.objects.filter(purchase_request=pr)
-            .select_related("uploaded_by")
-            .order_by("-uploaded_at")
-        )
+        receipts = Receipt.objects.filter(purchase_request=pr).order_by("-uploaded_at")
 
-        serializer = receipt_serializer.ReceiptSerializer(
-            receipts, many=True, context={"request": request}
+        rows = self.paginate_queryset(
+            receipts.values(*receipt_serializer.ReceiptRowSerializer.columns())
+        )
+        data = receipt_serializer.ReceiptRowSerializer().to_representation(rows)
+        return Response(
+            self.paginated_payload("receipts", data),
+            status=status.HTTP_200_OK,
         )
-        return Response({"receipts": serializer.data}, status=status.HTTP_200_OK)
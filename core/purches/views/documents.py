@@ -1,3 +1,9 @@
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -5,7 +11,12 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.purches import services as prs_services
-from core.purches.serializers.document import ProformaUploadSerializer
+from core.purches.models import ProformaJob
+from core.purches.serializers.document import (
+    ProformaBatchUploadSerializer,
+    ProformaJobSerializer,
+    ProformaUploadSerializer,
+)
 
 
 class ProformaUploadView(APIView):
@@ -17,9 +28,20 @@ class ProformaUploadView(APIView):
         serializer.is_valid(raise_exception=True)
         f = serializer.validated_data["file"]
         auto = serializer.validated_data.get("auto_create_po", False)
+        mode = serializer.validated_data.get("mode") or (
+            "async" if getattr(settings, "PROFORMA_ASYNC_EXTRACTION", False) else "sync"
+        )
+
+        if mode == "async":
+            job = prs_services.enqueue_proforma_job(
+                f, created_by=request.user, auto_create_po=auto
+            )
+            # eager runs finish before we get here, so report the current state
+            job.refresh_from_db()
+            out = ProformaJobSerializer(job, context={"request": request}).data
+            return Response(out, status=status.HTTP_202_ACCEPTED)
 
-        # process (sync or async)
-        extracted = prs_services.process_proforma_file(
+        extracted = prs_services.extract_proforma(
             f
         )  # returns dict with vendor, items, total, invoice_no, date
         result = {"extracted": extracted}
@@ -30,3 +52,85 @@ class ProformaUploadView(APIView):
             )
             result["purchase_order_id"] = po.id
         return Response(result, status=status.HTTP_201_CREATED)
+
+
+class ProformaBatchUploadView(APIView):
+    """
+    Extract many proformas in one request. Results are streamed back as
+    NDJSON, one line per file in completion order, then a summary line.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        request_body=ProformaBatchUploadSerializer,
+        tags=["Documents"],
+        security=[{"Bearer": []}],
+        responses={200: "application/x-ndjson stream", 400: "Bad Request"},
+    )
+    def post(self, request):
+        serializer = ProformaBatchUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        entries = serializer.validated_data["entries"]
+        auto = serializer.validated_data.get("auto_create_po", False)
+        user = request.user
+
+        def _line(obj):
+            return json.dumps(obj, cls=DjangoJSONEncoder) + "\n"
+
+        def stream():
+            succeeded = []
+            failed = 0
+            for index, name, extracted, error in prs_services.extract_proforma_batch(
+                entries
+            ):
+                row = {"type": "result", "index": index, "filename": name}
+                if error is None:
+                    row.update(status="ok", extracted=extracted)
+                    succeeded.append((index, name, extracted))
+                else:
+                    row.update(status="error", error=error)
+                    failed += 1
+                yield _line(row)
+
+            summary = {
+                "type": "summary",
+                "total": len(entries),
+                "succeeded": len(succeeded),
+                "failed": failed,
+            }
+            if auto and succeeded:
+                succeeded.sort(key=lambda r: r[0])
+                try:
+                    pos = prs_services.create_purchase_orders_from_proformas(
+                        [(name, extracted) for _, name, extracted in succeeded],
+                        created_by=user,
+                    )
+                    summary["purchase_orders"] = [
+                        {"index": i, "filename": name, "purchase_order_id": po.id}
+                        for (i, name, _), po in zip(succeeded, pos)
+                    ]
+                except Exception as exc:
+                    summary["purchase_order_error"] = str(exc)
+            yield _line(summary)
+
+        return StreamingHttpResponse(
+            stream(), content_type="application/x-ndjson", status=status.HTTP_200_OK
+        )
+
+
+class ProformaJobDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        tags=["Documents"],
+        security=[{"Bearer": []}],
+        responses={200: "OK", 404: "Not Found"},
+    )
+    def get(self, request, pk):
+        qs = ProformaJob.objects.all()
+        if not request.user.is_superuser:
+            qs = qs.filter(created_by=request.user)
+        job = get_object_or_404(qs, pk=pk)
+        out = ProformaJobSerializer(job, context={"request": request}).data
+        return Response(out, status=status.HTTP_200_OK)
@@ -0,0 +1,201 @@
+"""
+Streaming exports for finance reconciliation.
+
+Rows are read from a server-side cursor (QuerySet.iterator) in chunks of
+EXPORT_CHUNK_SIZE, serialized with the list endpoints' row serializers and
+written out chunk by chunk, so memory stays flat however many rows match.
+The format comes from ?output=, not the Accept header.
+"""
+
+import csv
+import datetime
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.purches.models import PurchaseOrder, PurchaseRequest, Receipt
+from core.purches.renderers import JSONRenderer
+from core.purches.serializers.export import ExportQuerySerializer
+from core.purches.serializers.purchase_order import PurchaseOrderRowSerializer
+from core.purches.serializers.purchase_request import PurchaseRequestRowSerializer
+from core.purches.serializers.receipt import ReceiptRowSerializer
+from core.purches.utils import user_is_role
+
+EXPORT_PARAMS = [
+    openapi.Parameter(
+        "output",
+        openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=["csv", "ndjson"],
+        default="csv",
+    ),
+    openapi.Parameter(
+        "date_from", openapi.IN_QUERY, type=openapi.TYPE_STRING, format="date"
+    ),
+    openapi.Parameter(
+        "date_to", openapi.IN_QUERY, type=openapi.TYPE_STRING, format="date"
+    ),
+    openapi.Parameter(
+        "status",
+        openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=list(PurchaseRequest.Status.values),
+    ),
+]
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+# spreadsheet apps run cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _IgnoreAccept(DefaultContentNegotiation):
+    """
+    Streams bypass the renderers, so a client asking for text/csv or
+    application/x-ndjson must not get a 406; errors still render as JSON.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+class ExportView(APIView):
+    """
+    Base for the export endpoints: subclasses set the queryset, the row
+    serializer and which fields the date range and status filter apply to.
+    """
+
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = _IgnoreAccept
+    queryset = None
+    row_serializer = None
+    date_field = None
+    status_field = None
+    filename = "export"
+
+    def _can_export(self, user):
+        return user.is_staff or user.is_superuser or user_is_role(user, "finance")
+
+    def filter_queryset(self, params):
+        qs = self.queryset.all()
+        if params.get("date_from"):
+            qs = qs.filter(
+                **{f"{self.date_field}__gte": _day_start(params["date_from"])}
+            )
+        if params.get("date_to"):
+            end = params["date_to"] + datetime.timedelta(days=1)
+            qs = qs.filter(**{f"{self.date_field}__lt": _day_start(end)})
+        if params.get("status"):
+            qs = qs.filter(**{self.status_field: params["status"]})
+        return qs.order_by(self.date_field, "id")
+
+    def _pages(self, qs):
+        """Serialized rows, one chunk at a time."""
+        chunk_size = max(int(getattr(settings, "EXPORT_CHUNK_SIZE", 2000)), 1)
+        serializer = self.row_serializer({"request": self.request})
+        rows = qs.values(*self.row_serializer.columns()).iterator(chunk_size=chunk_size)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield serializer.to_representation(chunk)
+                chunk = []
+        if chunk:
+            yield serializer.to_representation(chunk)
+
+    def _ndjson(self, qs):
+        renderer = JSONRenderer()
+        for page in self._pages(qs):
+            yield b"".join(renderer.render(row) + b"\n" for row in page)
+
+    def _csv(self, qs):
+        renderer = JSONRenderer()
+        writer = csv.writer(_Echo())
+        fields = self.row_serializer.fields
+
+        def cell(value):
+            if value is None:
+                return ""
+            if isinstance(value, (dict, list)):
+                return renderer.render(value).decode()
+            if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+                return "'" + value
+            return value
+
+        yield writer.writerow(fields)
+        for page in self._pages(qs):
+            yield "".join(
+                writer.writerow([cell(row[f]) for f in fields]) for row in page
+            )
+
+    @swagger_auto_schema(
+        tags=["Exports"],
+        security=[{"Bearer": []}],
+        manual_parameters=EXPORT_PARAMS,
+        responses={200: "text/csv or application/x-ndjson stream", 403: "Forbidden"},
+    )
+    def get(self, request):
+        if not self._can_export(request.user):
+            return Response(
+                {"detail": "insufficient_role"}, status=status.HTTP_403_FORBIDDEN
+            )
+        params = ExportQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        qs = self.filter_queryset(params.validated_data)
+
+        if params.validated_data["output"] == "ndjson":
+            response = StreamingHttpResponse(
+                self._ndjson(qs), content_type="application/x-ndjson"
+            )
+            extension = "ndjson"
+        else:
+            response = StreamingHttpResponse(
+                self._csv(qs), content_type="text/csv; charset=utf-8"
+            )
+            extension = "csv"
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.filename}.{extension}"'
+        )
+        return response
+
+
+class PurchaseRequestExportView(ExportView):
+    queryset = PurchaseRequest.objects.all()
+    row_serializer = PurchaseRequestRowSerializer
+    date_field = "created_at"
+    status_field = "status"
+    filename = "purchase-requests"
+
+
+class ReceiptExportView(ExportView):
+    queryset = Receipt.objects.all()
+    row_serializer = ReceiptRowSerializer
+    date_field = "uploaded_at"
+    status_field = "purchase_request__status"
+    filename = "receipts"
+
+
+class PurchaseOrderExportView(ExportView):
+    queryset = PurchaseOrder.objects.all()
+    row_serializer = PurchaseOrderRowSerializer
+    date_field = "generated_at"
+    status_field = "purchase_request__status"
+    filename = "purchase-orders"
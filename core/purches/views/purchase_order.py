@@ -1,4 +1,3 @@
-from django.utils.crypto import get_random_string
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -13,26 +12,29 @@ except Exception:
 
 import logging
 
+from core.purches import po_numbers
 from core.purches.models import PurchaseOrder
-from core.purches.serializers.purchase_order import PurchaseOrderSerializer
+from core.purches.pagination import RowListMixin
+from core.purches.serializers.purchase_order import (
+    PurchaseOrderRowSerializer,
+    PurchaseOrderSerializer,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def _generate_po_number():
-    return f"PO-{get_random_string(8).upper()}"
-
-
-class PurchaseOrderViewSet(viewsets.ModelViewSet):
+class PurchaseOrderViewSet(RowListMixin, viewsets.ModelViewSet):
     """
     CRUD for PurchaseOrder
     - list/retrieve: any authenticated user
     - create/update/destroy: staff/superuser or role 'finance' only
     """
 
-    queryset = PurchaseOrder.objects.all().order_by("-id")
+    queryset = PurchaseOrder.objects.all().order_by("-generated_at", "-id")
     serializer_class = PurchaseOrderSerializer
+    row_serializer = PurchaseOrderRowSerializer
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-generated_at", "-id")
 
     def _user_can_edit(self, user):
         return user.is_staff or user.is_superuser or user_is_role(user, "finance")
@@ -45,7 +47,7 @@ class PurchaseOrderViewSet(viewsets.ModelViewSet):
         # auto-generate po_number if client didn't provide one
         data = request.data.copy()
         if not data.get("po_number"):
-            data["po_number"] = _generate_po_number()
+            data["po_number"] = po_numbers.next_po_number()
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
@@ -1,5 +1,6 @@
 import logging
 
+from django.db.models import Count, Exists, Max, OuterRef
 from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
@@ -9,9 +10,16 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from core.purches import services as prs_services
-from core.purches.models import PurchaseRequest, Receipt
+from core.purches.conditional import ConditionalGetMixin
+from core.purches.models import Approval, PurchaseRequest, Receipt
+from core.purches.pagination import RowListMixin
+from core.purches.serializers.approval import (
+    ApprovalRowSerializer,
+    BulkDecisionSerializer,
+)
 from core.purches.serializers.purchase_request import (
     PurchaseRequestDetailSerializer,
+    PurchaseRequestRowSerializer,
     PurchaseRequestSerializer,
 )
 from core.purches.serializers.receipt import ReceiptSerializer, ReceiptUploadSerializer
@@ -20,12 +28,24 @@ from core.purches.utils import user_is_role
 logger = logging.getLogger(__name__)
 
 
-class PurchaseRequestViewSet(viewsets.ModelViewSet):
+def _list_freshness(qs):
+    """
+    (latest updated_at, row count) of a list queryset, in one query. Lists
+    validate on the ETag built from both: max(updated_at) alone doesn't move
+    when a row leaves the list, so they send no Last-Modified.
+    """
+    agg = qs.order_by().aggregate(last=Max("updated_at"), count=Count("id"))
+    return agg["last"], agg["count"]
+
+
+class PurchaseRequestViewSet(ConditionalGetMixin, RowListMixin, viewsets.ModelViewSet):
     queryset = PurchaseRequest.objects.all().select_related(
         "created_by", "purchase_order"
     )
     serializer_class = PurchaseRequestSerializer
+    row_serializer = PurchaseRequestRowSerializer
     permission_classes = [IsAuthenticated]
+    keyset_ordering = ("-created_at", "-id")
 
     def get_serializer_class(self):
         if getattr(self, "action", None) == "retrieve":
@@ -33,6 +53,10 @@ class PurchaseRequestViewSet(viewsets.ModelViewSet):
         return super().get_serializer_class()
 
     def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        return serializer_class.setup_eager_loading(self._scoped_queryset())
+
+    def _scoped_queryset(self):
         user = self.request.user
         qs = self.queryset
         role = (getattr(user, "role", "") or "").lower()
@@ -50,6 +74,45 @@ class PurchaseRequestViewSet(viewsets.ModelViewSet):
             return qs.order_by("-created_at")
         return qs.none()
 
+    def _pending_queryset(self):
+        """Requests waiting at the user's approval level that they haven't acted on."""
+        user = self.request.user
+        role_map = {"approver1": 1, "approver2": 2, "finance": 3}
+        user_role = next((r for r in role_map if user_is_role(user, r)), None)
+        level_value = role_map.get(user_role) if user_role else None
+
+        # served by the pr_pending_level_idx partial index; the anti-join is a
+        # NOT EXISTS probe per row, so no join fan-out and no DISTINCT
+        qs = PurchaseRequest.objects.filter(status=PurchaseRequest.Status.PENDING)
+        if level_value is not None:
+            qs = qs.filter(current_approval_level=level_value)
+        return qs.filter(
+            ~Exists(
+                Approval.objects.filter(purchase_request=OuterRef("pk"), approver=user)
+            )
+        ).order_by("-created_at", "-id")
+
+    def list(self, request, *args, **kwargs):
+        qs = self.filter_queryset(self._scoped_queryset())
+        not_modified = self.not_modified(request, None, *_list_freshness(qs))
+        if not_modified is not None:
+            return not_modified
+        return self.list_rows(qs)
+
+    def retrieve(self, request, *args, **kwargs):
+        updated_at = (
+            self._scoped_queryset()
+            .filter(pk=kwargs.get("pk"))
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        # unknown or hidden rows fall through to the normal 404
+        if updated_at is not None:
+            not_modified = self.not_modified(request, updated_at)
+            if not_modified is not None:
+                return not_modified
+        return super().retrieve(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         pending_value = getattr(PurchaseRequest.Status, "PENDING", "PENDING")
         serializer.save(created_by=self.request.user, status=pending_value)
@@ -113,6 +176,35 @@ class PurchaseRequestViewSet(viewsets.ModelViewSet):
         payload, status_code = prs_services.reject_purchase_request(user, pr)
         return Response(payload, status=status_code)
 
+    @swagger_auto_schema(
+        request_body=BulkDecisionSerializer,
+        tags=["Requests"],
+        security=[{"Bearer": []}],
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-decision")
+    def bulk_decision(self, request):
+        user = request.user
+        role_map = {"approver1": 1, "approver2": 2, "finance": 3}
+        user_role = next((r for r in role_map if user_is_role(user, r)), None)
+        if not user_role:
+            return Response({"detail": "insufficient_role"}, status=403)
+
+        serializer = BulkDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        decision = (
+            Approval.Decision.APPROVED
+            if serializer.validated_data["decision"] == "approve"
+            else Approval.Decision.REJECTED
+        )
+        results = prs_services.decide_purchase_requests(
+            user,
+            serializer.validated_data["ids"],
+            role_map[user_role],
+            decision,
+            comment=serializer.validated_data.get("comment"),
+        )
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(tags=["Requests"], security=[{"Bearer": []}])
     @action(detail=True, methods=["post"], url_path="submit-receipt")
     def submit_receipt(self, request, pk=None):
@@ -144,64 +236,41 @@ class PurchaseRequestViewSet(viewsets.ModelViewSet):
         ):
             return Response({"detail": "insufficient_role"}, status=403)
 
-        role_map = {"approver1": 1, "approver2": 2, "finance": 3}
-        user_role = next((r for r in role_map if user_is_role(user, r)), None)
-        level_value = role_map.get(user_role) if user_role else None
-
-        qs = self.queryset.filter(status=PurchaseRequest.Status.PENDING).order_by(
-            "-created_at"
-        )
-        if level_value is not None and hasattr(
-            PurchaseRequest, "current_approval_level"
-        ):
-            qs = qs.filter(current_approval_level=level_value)
-        qs = qs.exclude(approvals__approver=user).distinct()
-
-        page = self.paginate_queryset(qs)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data, status=200)
+        qs = self._pending_queryset()
+        # approving or rejecting bumps updated_at, and new requests add rows
+        not_modified = self.not_modified(request, None, *_list_freshness(qs))
+        if not_modified is not None:
+            return not_modified
+        return self.list_rows(qs)
 
     @swagger_auto_schema(tags=["Requests"], security=[{"Bearer": []}])
     @action(detail=True, methods=["get"], url_path="approvals")
     def approvals(self, request, pk=None):
+        freshness = PurchaseRequest.objects.filter(pk=pk).aggregate(
+            updated=Max("updated_at"),
+            count=Count("approvals"),
+            last=Max("approvals__created_at"),
+        )
+        if freshness["updated"] is not None:
+            # a collection: ETag only, like the lists
+            not_modified = self.not_modified(
+                request,
+                None,
+                freshness["updated"],
+                freshness["last"],
+                freshness["count"],
+            )
+            if not_modified is not None:
+                return not_modified
+
         pr = get_object_or_404(PurchaseRequest, pk=pk)
         self.check_object_permissions(request, pr)
 
         pr_data = PurchaseRequestSerializer(pr, context={"request": request}).data
 
-        qs = pr.approvals.all().select_related("approver")
-        result = []
-        for a in qs:
-            approver = getattr(a, "approver", None)
-            approver_name = None
-            if approver is not None:
-                first = getattr(approver, "first_name", "") or ""
-                last = getattr(approver, "last_name", "") or ""
-                username = getattr(approver, "username", None)
-                approver_name = f"{first} {last}".strip() or username
-
-            result.append(
-                {
-                    "id": getattr(a, "id", None),
-                    "level": getattr(a, "level", None),
-                    "decision": getattr(a, "decision", None),
-                    "comment": getattr(a, "comment", None),
-                    "created_at": getattr(a, "created_at", None),
-                    "approver_id": getattr(
-                        a, "approver_id", getattr(approver, "id", None)
-                    ),
-                    "purchase_request_id": getattr(
-                        a, "purchase_request_id", getattr(pr, "id", None)
-                    ),
-                    "approver_name": approver_name,
-                    "purchase_request": pr_data,
-                }
-            )
-
+        result = ApprovalRowSerializer({"purchase_request": pr_data}).serialize(
+            pr.approvals.all()
+        )
         return Response({"approvals": result}, status=status.HTTP_200_OK)
 
     def destroy(self, request, *args, **kwargs):
@@ -3,7 +3,7 @@ from datetime import timedelta
 from pathlib import Path
 
 from corsheaders.defaults import default_headers
-from decouple import config
+from decouple import Csv, config
 
 # Build paths
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -167,6 +167,19 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
+    # orjson when installed; output is byte-identical to DRF's JSON classes
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.purches.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.purches.renderers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # keyset pagination on (created_at, id); ?page_size= up to 200
+    "DEFAULT_PAGINATION_CLASS": "core.purches.pagination.KeysetPagination",
+    "PAGE_SIZE": config("API_PAGE_SIZE", default=50, cast=int),
 }
 
 SIMPLE_JWT = {
@@ -181,6 +194,77 @@ REST_AUTH_REGISTER_SERIALIZERS = {
     "REGISTER_SERIALIZER": "core.users.serializers.CustomRegisterSerializer"
 }
 
+# Celery / background jobs
+# without a broker URL tasks run eagerly in-process (local runs and tests)
+CELERY_BROKER_URL = config("CELERY_BROKER_URL", default="memory://")
+CELERY_RESULT_BACKEND = config("CELERY_RESULT_BACKEND", default=None)
+CELERY_TASK_ALWAYS_EAGER = config(
+    "CELERY_TASK_ALWAYS_EAGER",
+    default=CELERY_BROKER_URL.startswith("memory://"),
+    cast=bool,
+)
+CELERY_TASK_EAGER_PROPAGATES = False
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# outbox: side effects of approvals (PO generation) drained after commit
+OUTBOX_DRAIN_BATCH_SIZE = config("OUTBOX_DRAIN_BATCH_SIZE", default=100, cast=int)
+OUTBOX_MAX_ATTEMPTS = config("OUTBOX_MAX_ATTEMPTS", default=5, cast=int)
+# periodic drain (celery beat) for events whose post-commit enqueue failed
+OUTBOX_DRAIN_INTERVAL = config("OUTBOX_DRAIN_INTERVAL", default=60, cast=int)
+CELERY_BEAT_SCHEDULE = {
+    "drain-outbox": {
+        "task": "purches.drain_outbox",
+        "schedule": OUTBOX_DRAIN_INTERVAL,
+    },
+}
+
+# PO numbers: sequence-backed; per-process blocks of PO_NUMBER_BLOCK_SIZE
+# format fields: {seq}, {year}, {month}, {day}
+PO_NUMBER_FORMAT = config("PO_NUMBER_FORMAT", default="PO-{year}-{seq:07d}")
+PO_NUMBER_BLOCK_SIZE = config("PO_NUMBER_BLOCK_SIZE", default=20, cast=int)
+
+# Proforma extraction
+PROFORMA_ASYNC_EXTRACTION = config(
+    "PROFORMA_ASYNC_EXTRACTION", default=False, cast=bool
+)
+PROFORMA_CACHE_ENABLED = config("PROFORMA_CACHE_ENABLED", default=True, cast=bool)
+PROFORMA_CACHE_MAX_ENTRIES = config(
+    "PROFORMA_CACHE_MAX_ENTRIES", default=5000, cast=int
+)
+# OCR fallback: pages are rasterized and OCR'd in parallel
+PROFORMA_OCR_EXECUTOR = config("PROFORMA_OCR_EXECUTOR", default="thread")
+PROFORMA_OCR_WORKERS = config("PROFORMA_OCR_WORKERS", default=0, cast=int)
+PROFORMA_OCR_PAGE_TIMEOUT = config("PROFORMA_OCR_PAGE_TIMEOUT", default=60, cast=int)
+PROFORMA_OCR_DPI = config("PROFORMA_OCR_DPI", default=300, cast=int)
+# image clean-up before tesseract; an empty list disables it
+PROFORMA_OCR_PREPROCESS = config(
+    "PROFORMA_OCR_PREPROCESS",
+    default="normalize_dpi,grayscale,deskew,binarize,crop_margins",
+    cast=Csv(),
+)
+PROFORMA_OCR_MAX_SIDE = config("PROFORMA_OCR_MAX_SIDE", default=3600, cast=int)
+PROFORMA_OCR_MAX_SKEW = config("PROFORMA_OCR_MAX_SKEW", default=5.0, cast=float)
+# triage: image-covered pages go to OCR, or hybrid if they also carry text
+PROFORMA_TRIAGE_SAMPLE_PAGES = config(
+    "PROFORMA_TRIAGE_SAMPLE_PAGES", default=3, cast=int
+)
+PROFORMA_TRIAGE_MIN_CHARS = config("PROFORMA_TRIAGE_MIN_CHARS", default=50, cast=int)
+PROFORMA_TRIAGE_IMAGE_COVERAGE = config(
+    "PROFORMA_TRIAGE_IMAGE_COVERAGE", default=0.5, cast=float
+)
+# per-vendor parsing overrides, e.g.
+# [{"name": "acme", "fingerprint": r"ACME Supplies", "vendor": "ACME Supplies Ltd",
+#   "columns": {"quantity": ("qty", "pcs")}}]
+PROFORMA_VENDOR_TEMPLATES = []
+# batch upload: files (or zip entries) per request, per-file size, pool size
+PROFORMA_BATCH_MAX_FILES = config("PROFORMA_BATCH_MAX_FILES", default=100, cast=int)
+PROFORMA_BATCH_MAX_FILE_SIZE = config(
+    "PROFORMA_BATCH_MAX_FILE_SIZE", default=20 * 1024 * 1024, cast=int
+)
+PROFORMA_BATCH_WORKERS = config("PROFORMA_BATCH_WORKERS", default=4, cast=int)
+# rows per server-side cursor fetch in the streaming exports
+EXPORT_CHUNK_SIZE = config("EXPORT_CHUNK_SIZE", default=2000, cast=int)
+
 # Swagger / API docs
 SWAGGER_SETTINGS = {
     "USE_SESSION_AUTH": False,